@@ -0,0 +1,109 @@
+"""Benchmark /records leaderboard building on synthetic player records.
+
+Run from bot-files: python -m benchmarks.leaderboards [sizes...]
+"""
+
+import random
+import sys
+import time
+from modules.leaderboards import GLOBAL_MODE, build_leaderboards, np
+from modules.record_store import RECORD_MODES, RecordStore
+
+# Stat categories shown by /records
+CATEGORIES = [
+    "damage_caused",
+    "destroyed",
+    "assists",
+    "XP",
+    "captures",
+    "damage_blocked",
+    "credits",
+    "intel",
+    "confirms",
+    "denies",
+]
+
+VEHICLES = [f"Tank {i}" for i in range(60)]
+AGENTS = [f"Agent {i}" for i in range(20)]
+
+
+# Records shaped like player-records.json, about five per player
+def generate_records(size: int, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+    records = {mode: {} for mode in RECORD_MODES}
+    players = max(size // 5, 1)
+    for _ in range(size):
+        record = {
+            "vehicle": rng.choice(VEHICLES),
+            "agent": rng.choice(AGENTS),
+        }
+        for category in CATEGORIES:
+            record[category] = rng.randint(0, 50000)
+        player_id = f"player{rng.randrange(players)}"
+        records[rng.choice(RECORD_MODES)].setdefault(player_id, []).append(record)
+    return {"records": records}
+
+
+# The per-request path before leaderboards were prebuilt: copy, group, full sort
+def baseline_top(data: dict, mode: str, category: str, limit: int = 10) -> list:
+    modes = RECORD_MODES if mode == GLOBAL_MODE else [mode]
+    records = []
+    for m in modes:
+        for player_id, player_records in data["records"].get(m, {}).items():
+            for record in player_records:
+                record_copy = record.copy()
+                record_copy["_mode"] = m
+                record_copy["_player_id"] = player_id
+                records.append(record_copy)
+
+    player_best = {}
+    for record in records:
+        value = record.get(category, 0)
+        player_id = record["_player_id"]
+        if player_id not in player_best or value > player_best[player_id]["value"]:
+            player_best[player_id] = {"record": record, "value": value}
+    return sorted(player_best.values(), key=lambda x: x["value"], reverse=True)[:limit]
+
+
+def timed(function, *args, **kwargs) -> tuple:
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(size: int):
+    data = generate_records(size)
+    store, ingest_ms = timed(RecordStore.from_json, data)
+
+    _, baseline_ms = timed(baseline_top, data, GLOBAL_MODE, "XP")
+    python_boards, python_ms = timed(
+        build_leaderboards, store, CATEGORIES, use_numpy=False
+    )
+    print(f"{size:,} records")
+    print(f"  columnar ingest                  {ingest_ms:10.1f} ms")
+    print(f"  baseline, one board per request  {baseline_ms:10.1f} ms")
+    print(f"  python, all 50 boards once       {python_ms:10.1f} ms")
+
+    if np is not None:
+        numpy_boards, numpy_ms = timed(build_leaderboards, store, CATEGORIES)
+        same = all(
+            numpy_boards.get(*key).top() == board.top()
+            for key, board in python_boards.boards.items()
+        )
+        print(f"  numpy, all 50 boards once        {numpy_ms:10.1f} ms")
+        print(f"  numpy matches python             {same!s:>10}")
+
+    _, read_ms = timed(python_boards.get(GLOBAL_MODE, "XP").top)
+    print(f"  /records read per request        {read_ms:10.3f} ms")
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    if np is None:
+        print("NumPy is not installed, only the pure Python path is measured")
+    for size in sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
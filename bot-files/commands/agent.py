@@ -1,8 +1,8 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
+from modules.autocomplete import autocomplete_monitor
+from modules.datastore import DATASETS
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -12,39 +12,24 @@ logger = get_logger()
 class AgentCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.agents_url = "https://cdn1.heatlabs.net/agents.json"
+        self.agents_url = DATASETS["agents"]
 
+    # Fetch agents data through the shared dataset store
     async def fetch_agents(self):
-        try:
-            async with self.session.get(self.agents_url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    logger.info("Agents data fetched successfully")
-                    return data
-                logger.warning(f"Failed to fetch agents data: HTTP {response.status}")
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching agents data: {e}")
-            return None
+        return await self.bot.datastore.get(self.agents_url)
 
-    # Autocomplete callback for agent names
+    # Autocomplete callback for agent names, served from memory only
+    @autocomplete_monitor.timed("agent")
     async def agent_autocomplete(self, interaction: discord.Interaction, current: str):
-        agents_data = await self.fetch_agents()
-        if not agents_data:
+        if not self.bot.datastore.peek(self.agents_url):
             return []
 
-        agents = agents_data.get("agents", [])
-        # Filter to only agents with "Available Now" status
-        available_agents = [agent for agent in agents if agent.get("status") == "Available Now"]
-        choices = [agent["name"] for agent in available_agents]
+        view = await self.bot.views.agents()
         return [
             app_commands.Choice(name=choice, value=choice)
-            for choice in choices
-            if current.lower() in choice.lower()
-        ][
-            :25
+            for choice in autocomplete_monitor.search(
+                interaction, "agent", "name", view.index, current
+            )
         ]
 
     @app_commands.command(
@@ -74,45 +59,55 @@ class AgentCommands(commands.Cog):
             return
 
         try:
-            agents = agents_data.get("agents", [])
+            view = await self.bot.views.agents()
 
             # Find the agent by name
-            agent = next((a for a in agents if a["name"].lower() == name.lower() and a.get("status") == "Available Now"), None)
+            agent = view.find(name)
+
+            # Fall back to the closest name for typos
+            suggestions = []
+            if not agent:
+                resolved, suggestions = view.index.resolve(name)
+                if resolved:
+                    agent = view.find(resolved)
 
             if not agent:
                 embed = create_embed(command_name="Agent", color="#ff8300")
                 embed.description = f"❌ Agent '{name}' not found or not yet available. Please check the spelling and try again."
+                if suggestions:
+                    embed.description += "\n\n**Did you mean:** " + ", ".join(suggestions)
                 await interaction.followup.send(embed=embed)
                 logger.warning(f"Agent '{name}' not found or not available for {interaction.user}")
                 return
 
             # Create the main embed
             embed = create_embed(
-                command_name=f"Agent - {agent['name']}", color="#ff8300"
+                command_name=f"Agent - {agent.name}", color="#ff8300"
             )
 
             # Add agent image
-            if agent.get("image"):
-                embed.set_image(url=agent["image"])
+            if agent.image:
+                embed.set_image(url=agent.image)
 
             # Add specialty section
-            specialty = agent.get("specialty", "Unknown")
+            specialty = agent.specialty or "Unknown"
             embed.add_field(name="🎯 Specialty", value=specialty, inline=False)
 
             # Add specialty description
-            description = agent.get("description", "No description available.")
+            description = agent.description or "No description available."
             embed.add_field(
                 name="📝 Ability Description", value=description, inline=False
             )
 
             # Add story section
-            story = agent.get("story", "No story available.")
+            story = agent.story or "No story available."
             embed.add_field(name="📖 Story", value=story, inline=False)
 
-            # Add compatible tanks section
-            compatible_tanks = agent.get("compatibleTanks", [])
+            # Add compatible tanks section, from the graph once it knows the agent
+            node = self.bot.graph.get_agent(agent.name)
+            compatible_tanks = node.tanks if node else agent.compatible_tanks
             if compatible_tanks:
-                tank_names = "\n".join(f"• {tank['name']}" for tank in compatible_tanks)
+                tank_names = "\n".join(f"• {tank_name}" for tank_name in compatible_tanks)
                 embed.add_field(
                     name="🛡️ Compatible Tanks", value=tank_names, inline=False
                 )
@@ -124,7 +119,7 @@ class AgentCommands(commands.Cog):
                 )
 
             # Add status badge
-            status = agent.get("status", "Unknown")
+            status = agent.status or "Unknown"
             status_emoji = "✅" if status == "Available Now" else "🔒"
             embed.add_field(
                 name="Status", value=f"{status_emoji} {status}", inline=True
@@ -132,7 +127,7 @@ class AgentCommands(commands.Cog):
 
             await interaction.followup.send(embed=embed)
             logger.info(
-                f"Agent command completed successfully for {interaction.user} (Agent: {agent['name']})"
+                f"Agent command completed successfully for {interaction.user} (Agent: {agent.name})"
             )
 
         except Exception as e:
@@ -143,12 +138,6 @@ class AgentCommands(commands.Cog):
             )
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("AgentCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(AgentCommands(bot))
@@ -1,8 +1,7 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
+from modules.datastore import DATASETS
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,22 +14,11 @@ AGENT_STATUS = ["Available Now"]
 class AgentsListCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.agents_url = "https://cdn1.heatlabs.net/agents.json"
+        self.agents_url = DATASETS["agents"]
 
+    # Fetch agents data through the shared dataset store
     async def fetch_agents(self):
-        try:
-            async with self.session.get(self.agents_url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    logger.info("Agents data fetched successfully")
-                    return data
-                logger.warning(f"Failed to fetch agents data: HTTP {response.status}")
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching agents data: {e}")
-            return None
+        return await self.bot.datastore.get(self.agents_url)
 
     @app_commands.command(
         name="agents",
@@ -57,19 +45,14 @@ class AgentsListCommands(commands.Cog):
             return
 
         try:
-            agents = agents_data.get("agents", [])
-
-            # Filter to only agents
-            available_agents = [agent for agent in agents if agent.get("status") == "Available Now"]
+            # Sorted names of agents with "Available Now" status
+            agent_names = (await self.bot.views.agents()).names
 
-            if not available_agents:
+            if not agent_names:
                 embed.description = "No available agents found."
                 await interaction.followup.send(embed=embed)
                 return
 
-            # List all available agents
-            agent_names = sorted([agent.get("name", "Unknown") for agent in available_agents])
-
             embed.add_field(
                 name="✅ Available Agents",
                 value="\n".join(f"• {name}" for name in agent_names),
@@ -78,7 +61,7 @@ class AgentsListCommands(commands.Cog):
 
             embed.add_field(
                 name="📊 Total",
-                value=f"{len(available_agents)} Agent{'s' if len(available_agents) != 1 else ''}",
+                value=f"{len(agent_names)} Agent{'s' if len(agent_names) != 1 else ''}",
                 inline=True,
             )
 
@@ -92,12 +75,6 @@ class AgentsListCommands(commands.Cog):
             )
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("AgentsListCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(AgentsListCommands(bot))
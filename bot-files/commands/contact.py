@@ -16,13 +16,19 @@ class ContactCommands(commands.Cog):
         description="Contact the HEAT Labs team for support, feedback, or to join our team",
     )
     async def contact(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Contact", color="#ff8300")
         logger.info(
             f"Contact command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
+        # The embed never changes, so it is only rendered once
+        embed = self.bot.embed_cache.get("contact")
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Contact", color="#ff8300")
+
         try:
             # Contact description
             embed.description = (
@@ -81,6 +87,8 @@ class ContactCommands(commands.Cog):
                 inline=False,
             )
 
+            self.bot.embed_cache.set("contact", embed)
+
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Contact command completed successfully for {interaction.user}"
@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,36 +14,32 @@ class ContributorCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/contributors.json"
 
-    # Load contributors from JSON file
-    def load_contributor(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Contributor data loaded successfully")
-                return data.get("contributors", [])
-            else:
-                logger.warning(
-                    f"Failed to fetch contributors: HTTP {response.status_code}"
-                )
-                return []
-        except Exception as e:
-            logger.error(f"Error loading contributors: {e}")
+    # Load contributors through the shared dataset store
+    async def load_contributor(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("contributors", [])
 
     @app_commands.command(
         name="contributors",
         description="View all HEAT Labs contributors",
     )
     async def contributors(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Contributors", color="#ff8300")
         logger.info(
             f"Contributors command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        members = self.load_contributor()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("contributors", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Contributors", color="#ff8300")
+
+        members = await self.load_contributor()
 
         if not members:
             embed.description = (
@@ -66,6 +61,7 @@ class ContributorCommands(commands.Cog):
                 contributor_text.append(f"• **{member_name}** - {member_description}")
 
             embed.description = "\n".join(contributor_text)
+            self.bot.embed_cache.set("contributors", embed, url=self.config_file)
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Contributors command completed successfully for {interaction.user}"
@@ -6,10 +6,19 @@ import asyncio
 from modules.embeds import create_embed
 from modules.logger import get_logger
 from modules.cooldown import global_cooldown
+from modules.autocomplete import autocomplete_monitor
 
 logger = get_logger()
 
 
+# Cut a field value at the last whole line within Discord's field limit
+def trim_field(text: str, limit: int = 1024) -> str:
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut] if cut > 0 else text[:limit]
+
+
 class DebugCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -120,6 +129,20 @@ class DebugCommands(commands.Cog):
 
         return {"total_cogs": len(cogs), "cogs": cogs}
 
+    # Get dataset cache and circuit breaker status
+    async def get_data_layer_status(self) -> dict:
+        datastore = self.bot.datastore
+        return {
+            "stats": datastore.get_stats(),
+            "breakers": datastore.get_breaker_states(),
+            "http": self.bot.http_client.get_stats(),
+            "refreshes": self.bot.refresh_scheduler.get_status(),
+            "autocomplete": autocomplete_monitor.get_stats(),
+            "graph": self.bot.graph.get_stats(),
+            "embeds": self.bot.embed_cache.get_stats(),
+            "workers": self.bot.workers.get_stats(),
+        }
+
     @app_commands.command(
         name="debug", description="Developer command for bot diagnostics"
     )
@@ -150,6 +173,7 @@ class DebugCommands(commands.Cog):
             command_stats = await self.get_command_stats()
             cog_status = await self.get_cog_status()
             cooldown_test = await self.test_cooldown_system(interaction.user.id)
+            data_layer = await self.get_data_layer_status()
 
             # Add bot status section
             status_text = (
@@ -180,6 +204,132 @@ class DebugCommands(commands.Cog):
                 name="⏰ Cooldown System Test", value=cooldown_text, inline=False
             )
 
+            # Data layer metrics go in a second message, one embed can't hold them all
+            data_embed = create_embed(
+                command_name="Debug & Diagnostics - Data Layer", color="#ff8300"
+            )
+
+            # Add data layer status
+            cache_stats = data_layer["stats"]
+            data_text = (
+                f"**Cached Datasets:** {cache_stats['entries']} "
+                f"({cache_stats['cached_bytes'] / 1024:.1f} KB)\n"
+                f"**Hit Rate:** {cache_stats['hit_rate']:.1f}% "
+                f"({cache_stats['hits']} fresh, {cache_stats['stale_hits']} stale, "
+                f"{cache_stats['misses']} misses)\n"
+                f"**Fetches:** {cache_stats['fetches']} "
+                f"({cache_stats['not_modified']} not modified, "
+                f"{cache_stats['failures']} failed, "
+                f"{cache_stats['short_circuited']} short-circuited)\n"
+            )
+
+            graph_stats = data_layer["graph"]
+            if graph_stats["built_at"]:
+                data_text += (
+                    f"**Cross-references:** {graph_stats['tanks']} tanks, "
+                    f"{graph_stats['agents']} agents "
+                    f"(built <t:{int(graph_stats['built_at'])}:R> "
+                    f"in {graph_stats['build_ms']:.0f}ms)\n"
+                )
+            else:
+                data_text += "**Cross-references:** not built yet\n"
+
+            embed_stats = data_layer["embeds"]
+            data_text += (
+                f"**Rendered Embeds:** {embed_stats['entries']} "
+                f"({embed_stats['hit_rate']:.1f}% reused)\n"
+            )
+
+            breaker_emojis = {"closed": "🟢", "half-open": "🟡", "open": "🔴"}
+            for breaker in data_layer["breakers"]:
+                data_text += (
+                    f"{breaker_emojis.get(breaker['state'], '⚪')} **{breaker['name']}:** "
+                    f"{breaker['state'].upper()}"
+                )
+                if breaker["state"] == "open":
+                    data_text += f" (retry in {breaker['retry_in']:.0f}s)"
+                elif breaker["failures"]:
+                    data_text += f" ({breaker['failures']} recent failures)"
+                data_text += "\n"
+
+            data_embed.add_field(
+                name="🌐 Data Layer", value=trim_field(data_text), inline=False
+            )
+
+            # Add HTTP client metrics
+            http_text = ""
+            for host, metrics in data_layer["http"].items():
+                http_text += (
+                    f"**{host}:** {metrics['requests']} requests, "
+                    f"avg {metrics['avg_ms']:.0f}ms, max {metrics['max_ms']:.0f}ms, "
+                    f"{metrics['bytes_received'] / 1024:.1f} KB"
+                )
+                if metrics["errors"]:
+                    http_text += f", {metrics['errors']} errors"
+                http_text += "\n"
+
+            data_embed.add_field(
+                name="📡 HTTP Client",
+                value=trim_field(http_text) or "No requests yet",
+                inline=False,
+            )
+
+            # Add worker pool timings
+            workers_text = ""
+            for name, metrics in data_layer["workers"].items():
+                workers_text += (
+                    f"**{name}:** {metrics['runs']} runs "
+                    f"({metrics['in_process']} in process), "
+                    f"avg {metrics['avg_ms']:.0f}ms, max {metrics['max_ms']:.0f}ms"
+                )
+                if metrics["errors"]:
+                    workers_text += f", {metrics['errors']} errors"
+                workers_text += "\n"
+
+            data_embed.add_field(
+                name="⚙️ Workers",
+                value=trim_field(workers_text) or "No jobs yet",
+                inline=False,
+            )
+
+            # Add background refresh status
+            refresh_text = ""
+            for name, status in data_layer["refreshes"].items():
+                if status["last_refresh"]:
+                    refresh_text += (
+                        f"**{name}:** <t:{int(status['last_refresh'])}:R> "
+                        f"in {status['duration_ms']:.0f}ms "
+                        f"({'changed' if status['changed'] else 'unchanged'})\n"
+                    )
+                else:
+                    refresh_text += f"**{name}:** every {status['interval']}s, not yet run\n"
+
+            data_embed.add_field(
+                name="🔄 Dataset Refreshes",
+                value=trim_field(refresh_text) or "Scheduler not running",
+                inline=False,
+            )
+
+            # Add autocomplete latency
+            autocomplete_text = ""
+            for name, stats in data_layer["autocomplete"].items():
+                autocomplete_text += (
+                    f"**{name}:** {stats['calls']} keystrokes "
+                    f"({stats['narrowed']} narrowed), "
+                    f"avg {stats['avg_ms']:.1f}ms, max {stats['max_ms']:.1f}ms"
+                )
+                if stats["over_budget"] or stats["errors"]:
+                    autocomplete_text += (
+                        f", {stats['over_budget']} over budget, {stats['errors']} errors"
+                    )
+                autocomplete_text += "\n"
+
+            data_embed.add_field(
+                name="⌨️ Autocomplete",
+                value=trim_field(autocomplete_text) or "No autocomplete requests yet",
+                inline=False,
+            )
+
             # Add command overview
             command_names = [cmd["name"] for cmd in command_stats["commands"]]
             command_text = ", ".join([f"`/{cmd}`" for cmd in sorted(command_names)])
@@ -234,6 +384,7 @@ class DebugCommands(commands.Cog):
             )
 
             await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=data_embed)
             logger.info(
                 f"Debug command completed successfully for developer {interaction.user}"
             )
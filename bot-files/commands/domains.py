@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,34 +14,32 @@ class DomainsCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/domains.json"
 
-    # Load domains from JSON file
-    def load_domains(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Domains data loaded successfully")
-                return data.get("domains", [])
-            else:
-                logger.warning(f"Failed to fetch domains: HTTP {response.status_code}")
-                return []
-        except Exception as e:
-            logger.error(f"Error loading domains: {e}")
+    # Load domains through the shared dataset store
+    async def load_domains(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("domains", [])
 
     @app_commands.command(
         name="domains",
         description="View all official HEAT Labs domains and services",
     )
     async def domains(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Domains", color="#ff8300")
         logger.info(
             f"Domains command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        domains = self.load_domains()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("domains", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Domains", color="#ff8300")
+
+        domains = await self.load_domains()
 
         if not domains:
             embed.description = (
@@ -71,6 +68,8 @@ class DomainsCommands(commands.Cog):
                     inline=False,
                 )
 
+            self.bot.embed_cache.set("domains", embed, url=self.config_file)
+
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Domains command completed successfully for {interaction.user}"
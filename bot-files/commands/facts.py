@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import random
-import requests
 from modules.embeds import create_embed, add_embed_footer
 from modules.logger import get_logger
 
@@ -15,22 +14,11 @@ class FactsCommands(commands.Cog):
         self.bot = bot
         self.facts_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/facts.json"
         self.facts = []
-        self.load_facts()
 
-    # Load facts from JSON file
-    def load_facts(self) -> None:
-        try:
-            response = requests.get(self.facts_file)
-            if response.status_code == 200:
-                data = response.json()
-                self.facts = data.get("facts", [])
-                logger.info(f"Facts data loaded successfully: {len(self.facts)} facts")
-            else:
-                logger.warning(f"Failed to fetch facts: HTTP {response.status_code}")
-                self.facts = []
-        except Exception as e:
-            logger.error(f"Error loading facts: {e}")
-            self.facts = []
+    # Load facts through the shared dataset store
+    async def load_facts(self) -> None:
+        data = await self.bot.datastore.get(self.facts_file)
+        self.facts = data.get("facts", []) if data else []
 
     # Get a random fact
     def get_random_fact(self) -> str:
@@ -53,7 +41,7 @@ class FactsCommands(commands.Cog):
         )
 
         # Reload facts to ensure we have the latest data
-        self.load_facts()
+        await self.load_facts()
 
         if not self.facts:
             embed.description = (
@@ -1,8 +1,6 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
 from typing import Optional
 from modules.embeds import create_embed, add_embed_footer
 from modules.logger import get_logger
@@ -13,24 +11,21 @@ logger = get_logger()
 class HelpCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.help_url = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/help.json"
         self.commands_per_page = 10
 
-    # Fetch help data from JSON file
+    # Read help data from the local config
     async def fetch_help_data(self):
-        try:
-            async with self.session.get(self.help_url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    logger.info("Help data fetched successfully")
-                    return data
-                logger.warning(f"Failed to fetch help data: HTTP {response.status}")
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching help data: {e}")
-            return None
+        return await self.bot.config.get("help")
+
+    # Help pages, rebuilt once per help.json version
+    def build_help_pages(self, help_data) -> list:
+        return self.organize_commands_by_category(help_data.get("commands", []))
+
+    # Rebuild the help pages as soon as help.json changes
+    @commands.Cog.listener()
+    async def on_config_changed(self, name: str, data):
+        if name == "help":
+            self.bot.config.derive(name, "help_pages", self.build_help_pages)
 
     # Organize commands by category and prepare pagination
     def organize_commands_by_category(self, commands_data: list):
@@ -159,9 +154,12 @@ class HelpCommands(commands.Cog):
             return
 
         try:
-            commands_list = help_data.get("commands", [])
+            # Commands organized into pages with complete categories
+            pages = self.bot.config.derive(
+                "help", "help_pages", self.build_help_pages
+            )
 
-            if not commands_list:
+            if not pages:
                 embed = create_embed(command_name="Help", color="#ff8300")
                 embed.description = "⚠️ No commands available in the help system."
                 embed = add_embed_footer(embed)
@@ -169,8 +167,6 @@ class HelpCommands(commands.Cog):
                 logger.warning(f"No commands found in help data for {interaction.user}")
                 return
 
-            # Organize commands into pages with complete categories
-            pages = self.organize_commands_by_category(commands_list)
             total_pages = len(pages)
 
             # Validate page number
@@ -209,12 +205,12 @@ class HelpCommands(commands.Cog):
             if not help_data:
                 return []
 
-            commands_list = help_data.get("commands", [])
-            if not commands_list:
+            pages = self.bot.config.derive(
+                "help", "help_pages", self.build_help_pages
+            )
+            if not pages:
                 return []
 
-            # Organize commands into pages
-            pages = self.organize_commands_by_category(commands_list)
             total_pages = len(pages)
 
             # Create page suggestions
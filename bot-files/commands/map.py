@@ -1,8 +1,8 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
+from modules.autocomplete import autocomplete_monitor
+from modules.datastore import DATASETS
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -12,40 +12,25 @@ logger = get_logger()
 class MapCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.maps_url = "https://cdn1.heatlabs.net/maps.json"
+        self.maps_url = DATASETS["maps"]
 
+    # Fetch maps data through the shared dataset store
     async def fetch_maps(self):
-        try:
-            async with self.session.get(self.maps_url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    logger.info("Maps data fetched successfully")
-                    return data
-                logger.warning(f"Failed to fetch maps data: HTTP {response.status}")
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching maps data: {e}")
-            return None
+        return await self.bot.datastore.get(self.maps_url)
 
-    # Autocomplete callback for map names
+    # Autocomplete callback for map names, served from memory only
+    @autocomplete_monitor.timed("map")
     async def map_autocomplete(self, interaction: discord.Interaction, current: str):
-        maps_data = await self.fetch_maps()
-        if not maps_data:
+        if not self.bot.datastore.peek(self.maps_url):
             return []
 
-        maps = maps_data.get("maps", [])
-        # Filter to only maps with "Available Now" status
-        available_maps = [m for m in maps if m.get("status") == "Available Now"]
-        choices = [m["name"] for m in available_maps]
+        view = await self.bot.views.maps()
         return [
             app_commands.Choice(name=choice, value=choice)
-            for choice in choices
-            if current.lower() in choice.lower()
-        ][
-            :25
-        ]  # Discord limit
+            for choice in autocomplete_monitor.search(
+                interaction, "map", "name", view.index, current
+            )
+        ]
 
     @app_commands.command(
         name="map",
@@ -72,40 +57,47 @@ class MapCommands(commands.Cog):
             return
 
         try:
-            maps = maps_data.get("maps", [])
+            view = await self.bot.views.maps()
 
             # Find the map by name (case-insensitive)
-            map_data = next(
-                (m for m in maps if m["name"].lower() == name.lower() and m.get("status") == "Available Now"), None
-            )
+            map_data = view.find(name)
+
+            # Fall back to the closest name for typos
+            suggestions = []
+            if not map_data:
+                resolved, suggestions = view.index.resolve(name)
+                if resolved:
+                    map_data = view.find(resolved)
 
             if not map_data:
                 embed = create_embed(command_name="Map", color="#ff8300")
                 embed.description = f"❌ Map '{name}' not found or not yet available. Please check the spelling and try again."
+                if suggestions:
+                    embed.description += "\n\n**Did you mean:** " + ", ".join(suggestions)
                 await interaction.followup.send(embed=embed)
                 logger.warning(f"Map '{name}' not found or not available for {interaction.user}")
                 return
 
             # Create the main embed
             embed = create_embed(
-                command_name=f"Map - {map_data['name']}", color="#ff8300"
+                command_name=f"Map - {map_data.name}", color="#ff8300"
             )
 
             # Add map image
-            if map_data.get("image"):
-                embed.set_image(url=map_data["image"])
+            if map_data.image:
+                embed.set_image(url=map_data.image)
 
             # Add description
-            description = map_data.get("description", "No description available.")
+            description = map_data.description or "No description available."
             embed.add_field(name="📝 Description", value=description, inline=False)
 
             # Add status
-            status = map_data.get("status", "Unknown")
+            status = map_data.status or "Unknown"
             embed.add_field(name="📌 Status", value=status, inline=True)
 
             await interaction.followup.send(embed=embed)
             logger.info(
-                f"Map command completed successfully for {interaction.user} (Map: {map_data['name']})"
+                f"Map command completed successfully for {interaction.user} (Map: {map_data.name})"
             )
 
         except Exception as e:
@@ -114,12 +106,6 @@ class MapCommands(commands.Cog):
             embed.description = "⚠️ Error processing map data. Please try again later."
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("MapCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(MapCommands(bot))
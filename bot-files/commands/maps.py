@@ -1,8 +1,7 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
+from modules.datastore import DATASETS
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -12,35 +11,30 @@ logger = get_logger()
 class MapsListCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.maps_url = "https://cdn1.heatlabs.net/maps.json"
+        self.maps_url = DATASETS["maps"]
 
+    # Fetch maps data through the shared dataset store
     async def fetch_maps(self):
-        try:
-            async with self.session.get(self.maps_url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    logger.info("Maps data fetched successfully")
-                    return data
-                logger.warning(f"Failed to fetch maps data: HTTP {response.status}")
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching maps data: {e}")
-            return None
+        return await self.bot.datastore.get(self.maps_url)
 
     @app_commands.command(
         name="maps",
         description="View all available maps in HEAT Labs",
     )
     async def maps(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Maps", color="#ff8300")
         logger.info(
             f"Maps command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("maps", url=self.maps_url)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Maps", color="#ff8300")
+
         maps_data = await self.fetch_maps()
 
         if not maps_data:
@@ -52,19 +46,14 @@ class MapsListCommands(commands.Cog):
             return
 
         try:
-            maps = maps_data.get("maps", [])
+            # Sorted names of maps with "Available Now" status
+            map_names = (await self.bot.views.maps()).names
 
-            # Filter to only maps with "Available Now" status
-            available_maps = [m for m in maps if m.get("status") == "Available Now"]
-
-            if not available_maps:
+            if not map_names:
                 embed.description = "No available maps found."
                 await interaction.followup.send(embed=embed)
                 return
 
-            # Create map list
-            map_names = sorted([m.get("name", "Unknown") for m in available_maps])
-
             # Add all maps in one column
             embed.add_field(
                 name="🗺️ Available Maps",
@@ -74,10 +63,12 @@ class MapsListCommands(commands.Cog):
 
             embed.add_field(
                 name="📊 Total",
-                value=f"{len(available_maps)} Map{'s' if len(available_maps) != 1 else ''}",
+                value=f"{len(map_names)} Map{'s' if len(map_names) != 1 else ''}",
                 inline=True,
             )
 
+            self.bot.embed_cache.set("maps", embed, url=self.maps_url)
+
             await interaction.followup.send(embed=embed)
             logger.info(f"Maps command completed successfully for {interaction.user}")
 
@@ -86,12 +77,6 @@ class MapsListCommands(commands.Cog):
             embed.description = "⚠️ Error processing maps data. Please try again later."
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("MapsListCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(MapsListCommands(bot))
@@ -1,9 +1,8 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
 import random
-import requests
+from modules.datastore import DATASETS
 from modules.embeds import create_embed, add_embed_footer
 from modules.logger import get_logger
 
@@ -13,24 +12,13 @@ logger = get_logger()
 class MemesCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.memes_file = "https://cdn1.heatlabs.net/memes.json"
+        self.memes_file = DATASETS["memes"]
         self.memes = []
-        self.load_memes()
 
-    # Load memes from JSON file
-    def load_memes(self) -> None:
-        try:
-            response = requests.get(self.memes_file)
-            if response.status_code == 200:
-                data = response.json()
-                self.memes = data
-                logger.info(f"Memes data loaded successfully: {len(self.memes)} memes")
-            else:
-                logger.warning(f"Failed to fetch memes: HTTP {response.status_code}")
-                self.memes = []
-        except Exception as e:
-            logger.error(f"Error loading memes: {e}")
-            self.memes = []
+    # Load memes through the shared dataset store
+    async def load_memes(self) -> None:
+        data = await self.bot.datastore.get(self.memes_file)
+        self.memes = data or []
 
     # Get a random meme
     def get_random_meme(self) -> dict:
@@ -52,7 +40,7 @@ class MemesCommands(commands.Cog):
         )
 
         # Reload memes to ensure we have the latest data
-        self.load_memes()
+        await self.load_memes()
 
         if not self.memes:
             embed.description = (
@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,34 +14,32 @@ class PartnersCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/partners.json"
 
-    # Load partners from JSON file
-    def load_partners(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Partners data loaded successfully")
-                return data.get("partners", [])
-            else:
-                logger.warning(f"Failed to fetch partners: HTTP {response.status_code}")
-                return []
-        except Exception as e:
-            logger.error(f"Error loading partners: {e}")
+    # Load partners through the shared dataset store
+    async def load_partners(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("partners", [])
 
     @app_commands.command(
         name="partners",
         description="Check out exclusive offers and perks from HEAT Labs partners.",
     )
     async def partners(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Partners", color="#ff8300")
         logger.info(
             f"Partners command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        partners = self.load_partners()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("partners", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Partners", color="#ff8300")
+
+        partners = await self.load_partners()
 
         if not partners:
             embed.description = (
@@ -78,6 +75,8 @@ class PartnersCommands(commands.Cog):
                 inline=False,
             )
 
+            self.bot.embed_cache.set("partners", embed, url=self.config_file)
+
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Partners command completed successfully for {interaction.user}"
@@ -16,13 +16,19 @@ class PlaygroundCommands(commands.Cog):
         description="Explore all HEAT Labs playground features and experimental tools",
     )
     async def playground(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Playground", color="#ff8300")
         logger.info(
             f"Playground command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
+        # The embed never changes, so it is only rendered once
+        embed = self.bot.embed_cache.get("playground")
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Playground", color="#ff8300")
+
         try:
             # Main description
             embed.description = "Explore experimental features, tier lists, countdowns, and community tools built around World of Tanks: HEAT. Stay ahead with behind-the-scenes updates and exclusive developer content."
@@ -67,6 +73,8 @@ class PlaygroundCommands(commands.Cog):
                 inline=False,
             )
 
+            self.bot.embed_cache.set("playground", embed)
+
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Playground command completed successfully for {interaction.user}"
@@ -1,9 +1,8 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
 import random
+from modules.datastore import DATASETS
 from modules.embeds import create_embed, add_embed_footer
 from modules.logger import get_logger
 
@@ -13,45 +12,14 @@ logger = get_logger()
 class RandomCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-
         # JSON data URLs
-        self.tanks_url = "https://cdn1.heatlabs.net/tanks.json"
-        self.maps_url = "https://cdn1.heatlabs.net/maps.json"
-        self.agents_url = "https://cdn1.heatlabs.net/agents.json"
+        self.tanks_url = DATASETS["tanks"]
+        self.maps_url = DATASETS["maps"]
+        self.agents_url = DATASETS["agents"]
 
-    # Fetch data from URL
+    # Fetch data through the shared dataset store
     async def fetch_data(self, url: str):
-        try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    return data
-                logger.warning(
-                    f"Failed to fetch data from {url}: HTTP {response.status}"
-                )
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching data from {url}: {e}")
-            return None
-
-    # Filter items by state
-    def filter_by_state(self, items):
-        if isinstance(items, dict) and "agents" in items:
-            # Handle agents.json structure
-            items_list = items.get("agents", [])
-        elif isinstance(items, dict) and "maps" in items:
-            # Handle maps.json structure
-            items_list = items.get("maps", [])
-        elif isinstance(items, list):
-            # Handle tanks.json structure
-            items_list = items
-        else:
-            items_list = []
-
-        # Filter only items with state "displayed"
-        return [item for item in items_list if item.get("state") == "displayed"]
+        return await self.bot.datastore.get(url)
 
     # Get a random item from filtered list
     def get_random_item(self, items_list):
@@ -61,12 +29,12 @@ class RandomCommands(commands.Cog):
 
     # Create tank embed
     def create_tank_embed(self, tank):
-        tank_name = tank.get("name", "Unknown Tank")
-        tank_slug = tank.get("slug", "")
-        tank_nation = tank.get("nation", "Unknown Nation")
-        tank_type = tank.get("type", "Unknown Type")
-        tank_class = tank.get("class", "Unknown Class")
-        tank_image = tank.get("image", "")
+        tank_name = tank.name
+        tank_slug = tank.slug or ""
+        tank_nation = tank.nation or "Unknown Nation"
+        tank_type = tank.type or "Unknown Type"
+        tank_class = tank.tank_class or "Unknown Class"
+        tank_image = tank.image or ""
 
         embed = create_embed(
             command_name="Random Tank",
@@ -96,10 +64,10 @@ class RandomCommands(commands.Cog):
 
     # Create map embed
     def create_map_embed(self, map_item):
-        map_name = map_item.get("name", "Unknown Map")
-        map_slug = map_item.get("slug", "")
-        map_description = map_item.get("description", "No description available.")
-        map_image = map_item.get("image", "")
+        map_name = map_item.name
+        map_slug = map_item.slug or ""
+        map_description = map_item.description or "No description available."
+        map_image = map_item.image or ""
 
         embed = create_embed(
             command_name="Random Map",
@@ -125,12 +93,12 @@ class RandomCommands(commands.Cog):
 
     # Create agent embed
     def create_agent_embed(self, agent):
-        agent_name = agent.get("name", "Unknown Agent")
-        agent_slug = agent.get("slug", "")
-        agent_specialty = agent.get("specialty", "Unknown Specialty")
-        agent_status = agent.get("status", "Unknown Status")
-        agent_story = agent.get("story", "No story available.")
-        agent_image = agent.get("image", "")
+        agent_name = agent.name
+        agent_slug = agent.slug or ""
+        agent_specialty = agent.specialty or "Unknown Specialty"
+        agent_status = agent.status or "Unknown Status"
+        agent_story = agent.story or "No story available."
+        agent_image = agent.image or ""
 
         embed = create_embed(
             command_name="Random Agent",
@@ -218,9 +186,9 @@ class RandomCommands(commands.Cog):
             )
             return
 
-        # Filter and get random item
-        filtered_items = self.filter_by_state(data)
-        random_item = self.get_random_item(filtered_items)
+        # Pick from the precomputed "displayed" view
+        view = await self.bot.views.get(f"{type_name}s")
+        random_item = self.get_random_item(view.displayed)
 
         if not random_item:
             embed = create_embed(
@@ -254,12 +222,6 @@ class RandomCommands(commands.Cog):
             f"Random {type_name} command completed successfully for {interaction.user}"
         )
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("RandomCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(RandomCommands(bot))
@@ -1,16 +1,16 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
 import re
+from modules.datastore import DATASETS
 from modules.embeds import create_embed, add_embed_footer
+from modules.leaderboards import GLOBAL_MODE, build_leaderboards
 from modules.logger import get_logger
 
 logger = get_logger()
 
 # Constants
-RECORDS_URL = "https://cdn1.heatlabs.net/player-records.json"
+RECORDS_URL = DATASETS["player-records"]
 
 # Mode choices
 MODES = [
@@ -57,86 +57,34 @@ MODE_DISPLAY = {
 class RecordsCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.records_data = None
-        self.last_fetch_time = 0
 
     async def fetch_records_data(self):
-        """Fetch records data with caching (5 minute TTL)"""
-        import time
-        current_time = time.time()
-
-        # Cache for 5 minutes
-        if self.records_data and (current_time - self.last_fetch_time < 300):
-            return self.records_data
-
-        try:
-            async with self.session.get(RECORDS_URL) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    self.records_data = data
-                    self.last_fetch_time = current_time
-                    logger.info("Records data fetched successfully")
-                    return data
-                logger.warning(f"Failed to fetch records data: HTTP {response.status}")
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching records data: {e}")
-            return None
-
-    def get_mode_records(self, data, mode):
-        """Get records for a specific mode"""
-        if mode == "global":
-            # Combine all modes
-            all_records = []
-            for m in ["conquest", "control", "hardpoint", "kill-confirmed"]:
-                if m in data.get("records", {}):
-                    mode_records = data["records"].get(m, {})
-                    for player_id, player_records in mode_records.items():
-                        for record in player_records:
-                            record_copy = record.copy()
-                            record_copy["_mode"] = m
-                            record_copy["_player_id"] = player_id
-                            all_records.append(record_copy)
-            return all_records
-        else:
-            # Get specific mode
-            mode_records = data.get("records", {}).get(mode, {})
-            records = []
-            for player_id, player_records in mode_records.items():
-                for record in player_records:
-                    record_copy = record.copy()
-                    record_copy["_mode"] = mode
-                    record_copy["_player_id"] = player_id
-                    records.append(record_copy)
-            return records
-
-    def get_top_records(self, records, stat_key, limit=10):
-        """Get top records for a specific stat, with each player appearing once"""
-        # Group by player, keep highest value
-        player_best = {}
-        for record in records:
-            player_id = record.get("_player_id")
-            if not player_id:
-                continue
-            value = record.get(stat_key, 0)
-            if value is None:
-                continue
-            if player_id not in player_best or value > player_best[player_id]["value"]:
-                player_best[player_id] = {
-                    "record": record,
-                    "value": value
-                }
-
-        # Convert to list and sort
-        sorted_records = sorted(
-            player_best.values(),
-            key=lambda x: x["value"],
-            reverse=True
+        """Read the columnar records store kept fresh by the refresh scheduler"""
+        return await self.bot.datastore.get(RECORDS_URL)
+
+    def build_leaderboards(self, store):
+        """Build every mode and category leaderboard from one records version"""
+        return build_leaderboards(store, list(CATEGORIES))
+
+    async def get_leaderboards(self):
+        """Get the current records leaderboards, built off the event loop"""
+        return await self.bot.datastore.derive_async(
+            RECORDS_URL, "leaderboards", self.build_leaderboards
         )
 
-        return sorted_records[:limit]
+    @commands.Cog.listener()
+    async def on_dataset_changed(self, url, data):
+        """Rebuild every leaderboard once when player records change"""
+        if url != RECORDS_URL:
+            return
+        leaderboards = await self.get_leaderboards()
+        if leaderboards is None:
+            return
+        logger.info(
+            f"Records leaderboards rebuilt: {len(leaderboards.boards)} boards "
+            f"from {leaderboards.count(GLOBAL_MODE)} records "
+            f"({leaderboards.store.get_size() / 1024:.0f} KB of columns)"
+        )
 
     def format_number(self, num):
         """Format large numbers with K/M suffix"""
@@ -186,7 +134,7 @@ class RecordsCommands(commands.Cog):
 
         # Fetch data
         data = await self.fetch_records_data()
-        if not data:
+        if data is None:
             embed = create_embed(
                 title="Records Unavailable",
                 description="Failed to fetch records data. Please try again later.",
@@ -195,10 +143,11 @@ class RecordsCommands(commands.Cog):
             await interaction.followup.send(embed=embed)
             return
 
-        # Get records for the selected mode
-        records = self.get_mode_records(data, mode_value)
+        # Read the prebuilt leaderboard for the selected mode and category
+        leaderboards = await self.get_leaderboards()
+        leaderboard = leaderboards.get(mode_value, category_value)
 
-        if not records:
+        if not leaderboards.count(mode_value):
             embed = create_embed(
                 title="No Records Found",
                 description=f"No records found for **{MODE_DISPLAY.get(mode_value, mode_value)}** mode.",
@@ -207,10 +156,7 @@ class RecordsCommands(commands.Cog):
             await interaction.followup.send(embed=embed)
             return
 
-        # Get top records for the selected category
-        top_records = self.get_top_records(records, category_value, 10)
-
-        if not top_records:
+        if not leaderboard:
             embed = create_embed(
                 title="No Records Found",
                 description=f"No records found for **{category_label}** in **{MODE_DISPLAY.get(mode_value, mode_value)}** mode.",
@@ -229,14 +175,9 @@ class RecordsCommands(commands.Cog):
 
         # Build the leaderboard with better spacing
         leaderboard_lines = []
-        for idx, entry in enumerate(top_records, 1):
-            record = entry["record"]
-            value = entry["value"]
-            player_id = record.get("_player_id", "Unknown")
-            vehicle = record.get("vehicle", "N/A")
-            agent = record.get("agent", "N/A")
-            mode_tag = record.get("_mode", "")
-
+        for idx, (player_id, value, vehicle, agent, mode_tag) in enumerate(
+            leaderboard.top(), 1
+        ):
             # Medal symbols for top 3
             medal = ""
             if idx == 1:
@@ -281,11 +222,6 @@ class RecordsCommands(commands.Cog):
         await interaction.followup.send(embed=embed)
         logger.info(f"Records command completed for {interaction.user}")
 
-    def cog_unload(self) -> None:
-        import asyncio
-        asyncio.create_task(self.session.close())
-        logger.info("RecordsCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(RecordsCommands(bot))
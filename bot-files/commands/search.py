@@ -0,0 +1,238 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import asyncio
+import time
+from modules.datastore import DATASETS
+from modules.embeds import create_embed
+from modules.index import SearchIndex
+from modules.logger import get_logger
+from modules.models import parse_tournaments
+
+logger = get_logger()
+
+# How each kind of result is shown and which command opens it
+RESULT_KINDS = {
+    "tank": {"emoji": "🛡️", "label": "Tank", "command": "/tank"},
+    "map": {"emoji": "🗺️", "label": "Map", "command": "/map"},
+    "agent": {"emoji": "👤", "label": "Agent", "command": "/agent"},
+    "tournament": {"emoji": "🏆", "label": "Tournament", "command": "/tournament"},
+    "command": {"emoji": "📖", "label": "Command", "command": None},
+}
+
+# Discord's limit on the length of an embed field value
+FIELD_LIMIT = 1024
+
+
+class SearchCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.tanks_url = DATASETS["tanks"]
+        self.maps_url = DATASETS["maps"]
+        self.agents_url = DATASETS["agents"]
+        self.index = None
+        self.index_version = None
+
+    # Join whole result lines up to the field limit, noting how many were left out
+    def format_results(self, lines: list) -> str:
+        more_size = len(f"\n…and {len(lines)} more")
+        shown = []
+        size = 0
+        for position, line in enumerate(lines):
+            size += len(line) + (1 if shown else 0)
+            is_last = position == len(lines) - 1
+            if size + (0 if is_last else more_size) > FIELD_LIMIT:
+                break
+            shown.append(line)
+
+        if len(shown) < len(lines):
+            shown.append(f"…and {len(lines) - len(shown)} more")
+        return "\n".join(shown)
+
+    # Versions of every source, the index is rebuilt when any of them changes
+    def get_sources_version(self) -> tuple:
+        return (
+            self.bot.datastore.get_version(self.tanks_url),
+            self.bot.datastore.get_version(self.maps_url),
+            self.bot.datastore.get_version(self.agents_url),
+            self.bot.config.get_version("tournaments"),
+            self.bot.config.get_version("help"),
+        )
+
+    # Collect searchable documents from the available tanks, maps and agents and the
+    # published tournaments and commands
+    def build_documents(self, tanks, maps, agents, tournaments, help_data) -> list:
+        documents = []
+
+        for tank in tanks:
+            documents.append(
+                (
+                    "tank",
+                    tank.name,
+                    f"{tank.nation or 'Unknown'} {tank.type or ''}".strip(),
+                    [
+                        (tank.name, 3),
+                        (tank.nation, 2),
+                        (tank.type, 2),
+                        (tank.description, 1),
+                    ],
+                )
+            )
+
+        for map_data in maps:
+            documents.append(
+                (
+                    "map",
+                    map_data.name,
+                    None,
+                    [(map_data.name, 3), (map_data.description, 1)],
+                )
+            )
+
+        for agent in agents:
+            documents.append(
+                (
+                    "agent",
+                    agent.name,
+                    agent.specialty,
+                    [
+                        (agent.name, 3),
+                        (agent.specialty, 2),
+                        (agent.description, 1),
+                        (agent.story, 1),
+                    ],
+                )
+            )
+
+        for tournament in tournaments:
+            if not tournament.published:
+                continue
+            documents.append(
+                (
+                    "tournament",
+                    tournament.name,
+                    tournament.mode,
+                    [
+                        (tournament.name, 3),
+                        (tournament.mode, 2),
+                        (tournament.description, 1),
+                    ],
+                )
+            )
+
+        for command in (help_data or {}).get("commands", []):
+            documents.append(
+                (
+                    "command",
+                    command["name"],
+                    command.get("usage"),
+                    [
+                        (command["name"], 3),
+                        (command.get("category"), 2),
+                        (command.get("description"), 1),
+                    ],
+                )
+            )
+
+        return documents
+
+    # Get the search index, rebuilding it only if a source changed
+    async def get_index(self) -> SearchIndex:
+        version = self.get_sources_version()
+        if self.index is not None and version == self.index_version:
+            return self.index
+
+        views = await asyncio.gather(
+            *(self.bot.views.get(name) for name in ("tanks", "maps", "agents"))
+        )
+        start = time.perf_counter()
+        documents = self.build_documents(
+            *(view.available if view else () for view in views),
+            self.bot.config.derive("tournaments", "tournaments", parse_tournaments)
+            or (),
+            self.bot.config.peek("help"),
+        )
+        self.index = SearchIndex(documents)
+        self.index_version = version
+
+        logger.info(
+            f"Search index built with {len(self.index)} documents "
+            f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+        return self.index
+
+    # Rebuild the index as soon as one of its sources changes
+    @commands.Cog.listener()
+    async def on_dataset_changed(self, url: str, data):
+        if url in (self.tanks_url, self.maps_url, self.agents_url):
+            await self.get_index()
+
+    @commands.Cog.listener()
+    async def on_config_changed(self, name: str, data):
+        if name in ("tournaments", "help"):
+            await self.get_index()
+
+    @app_commands.command(
+        name="search",
+        description="Search tanks, maps, agents, tournaments and commands at once",
+    )
+    @app_commands.describe(query="What you are looking for")
+    async def search(self, interaction: discord.Interaction, query: str) -> None:
+        await interaction.response.defer(thinking=True)
+
+        embed = create_embed(command_name="Search", color="#ff8300")
+        logger.info(
+            f"Search command invoked by {interaction.user} for '{query}' in guild {interaction.guild.name}"
+        )
+
+        try:
+            # Make sure every source is loaded before the first search
+            await asyncio.gather(
+                self.bot.datastore.get(self.tanks_url),
+                self.bot.datastore.get(self.maps_url),
+                self.bot.datastore.get(self.agents_url),
+                self.bot.config.get("tournaments"),
+                self.bot.config.get("help"),
+            )
+
+            start = time.perf_counter()
+            index = await self.get_index()
+            results = index.search(query)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            if not results:
+                embed.description = f"❌ Nothing found for '{query}'. Try a shorter or different search."
+                await interaction.followup.send(embed=embed)
+                logger.info(f"Search for '{query}' found nothing for {interaction.user}")
+                return
+
+            lines = []
+            for kind, name, detail in results:
+                info = RESULT_KINDS[kind]
+                line = f"{info['emoji']} **{name}** • {info['label']}"
+                if detail:
+                    line += f" • {detail}"
+                if info["command"]:
+                    line += f"\n  `{info['command']} {name}`"
+                lines.append(line)
+
+            embed.add_field(
+                name=f"🔎 Results for '{query}'",
+                value=self.format_results(lines),
+                inline=False,
+            )
+
+            await interaction.followup.send(embed=embed)
+            logger.info(
+                f"Search for '{query}' returned {len(results)} results in {elapsed:.2f}ms for {interaction.user}"
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing search for {interaction.user}: {e}")
+            embed.description = "⚠️ Error processing search. Please try again later."
+            await interaction.followup.send(embed=embed)
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(SearchCommands(bot))
+    logger.info("SearchCommands cog loaded")
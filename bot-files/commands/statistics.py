@@ -1,9 +1,9 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
-import requests
+import asyncio
 from datetime import datetime
+from modules.datastore import DATASETS
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -13,60 +13,21 @@ logger = get_logger()
 class StatisticsCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.config_file = "https://cdn1.heatlabs.net/home-stats.json"
-        self.changelog_file = "https://cdn1.heatlabs.net/changelog.json"
-        self.game_builds_file = "https://cdn1.heatlabs.net/game_builds.json"
+        self.config_file = DATASETS["home-stats"]
+        self.changelog_file = DATASETS["changelog"]
+        self.game_builds_file = DATASETS["game-builds"]
 
-    # Load statistics from JSON file
-    def load_statistics(self) -> dict:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Statistics data loaded successfully")
-                return data
-            else:
-                logger.warning(
-                    f"Failed to fetch statistics: HTTP {response.status_code}"
-                )
-                return {}
-        except Exception as e:
-            logger.error(f"Error loading statistics: {e}")
-            return {}
+    # Load statistics through the shared dataset store
+    async def load_statistics(self) -> dict:
+        return await self.bot.datastore.get(self.config_file) or {}
 
-    # Load changelog data
-    def load_changelog(self) -> dict:
-        try:
-            response = requests.get(self.changelog_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Changelog data loaded successfully")
-                return data
-            else:
-                logger.warning(
-                    f"Failed to fetch changelog: HTTP {response.status_code}"
-                )
-                return {}
-        except Exception as e:
-            logger.error(f"Error loading changelog: {e}")
-            return {}
+    # Load changelog data through the shared dataset store
+    async def load_changelog(self) -> dict:
+        return await self.bot.datastore.get(self.changelog_file) or {}
 
-    # Load game builds data
-    def load_game_builds(self) -> dict:
-        try:
-            response = requests.get(self.game_builds_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Game builds data loaded successfully")
-                return data
-            else:
-                logger.warning(
-                    f"Failed to fetch game builds: HTTP {response.status_code}"
-                )
-                return {}
-        except Exception as e:
-            logger.error(f"Error loading game builds: {e}")
-            return {}
+    # Load game builds data through the shared dataset store
+    async def load_game_builds(self) -> dict:
+        return await self.bot.datastore.get(self.game_builds_file) or {}
 
     # Calculate total coffee cups since creation date
     def calculate_total_coffee(
@@ -212,10 +173,12 @@ class StatisticsCommands(commands.Cog):
             f"Statistics command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        # Load all data sources
-        stats_data = self.load_statistics()
-        changelog_data = self.load_changelog()
-        game_builds_data = self.load_game_builds()
+        # Load all data sources concurrently
+        stats_data, changelog_data, game_builds_data = await asyncio.gather(
+            self.load_statistics(),
+            self.load_changelog(),
+            self.load_game_builds(),
+        )
 
         if not stats_data:
             embed.description = (
@@ -2,7 +2,6 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import json
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -14,36 +13,32 @@ class SupportCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/support.json"
 
-    # Load support methods from JSON file
-    def load_support_methods(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Support methods data loaded successfully")
-                return data.get("support", [])
-            else:
-                logger.warning(
-                    f"Failed to fetch support methods: HTTP {response.status_code}"
-                )
-                return []
-        except Exception as e:
-            logger.error(f"Error loading support methods: {e}")
+    # Load support methods through the shared dataset store
+    async def load_support_methods(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("support", [])
 
     @app_commands.command(
         name="support",
         description="Support HEAT Labs development and help sustain our services",
     )
     async def support(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Support", color="#ff8300")
         logger.info(
             f"Support command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        support_methods = self.load_support_methods()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("support", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Support", color="#ff8300")
+
+        support_methods = await self.load_support_methods()
 
         if not support_methods:
             embed.description = (
@@ -115,6 +110,8 @@ class SupportCommands(commands.Cog):
                 inline=False,
             )
 
+            self.bot.embed_cache.set("support", embed, url=self.config_file)
+
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Support command completed successfully for {interaction.user}"
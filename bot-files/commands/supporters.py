@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,36 +14,32 @@ class SupporterCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/supporters.json"
 
-    # Load supporters from JSON file
-    def load_supporter(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Supporter data loaded successfully")
-                return data.get("supporters", [])
-            else:
-                logger.warning(
-                    f"Failed to fetch supporters: HTTP {response.status_code}"
-                )
-                return []
-        except Exception as e:
-            logger.error(f"Error loading supporters: {e}")
+    # Load supporters through the shared dataset store
+    async def load_supporter(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("supporters", [])
 
     @app_commands.command(
         name="supporters",
         description="View all HEAT Labs supporters",
     )
     async def supporters(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Supporters", color="#ff8300")
         logger.info(
             f"Supporters command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        members = self.load_supporter()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("supporters", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Supporters", color="#ff8300")
+
+        members = await self.load_supporter()
 
         if not members:
             embed.description = (
@@ -66,6 +61,7 @@ class SupporterCommands(commands.Cog):
                 supporter_text.append(f"• **{member_name}** - {member_description}")
 
             embed.description = "\n".join(supporter_text)
+            self.bot.embed_cache.set("supporters", embed, url=self.config_file)
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Supporters command completed successfully for {interaction.user}"
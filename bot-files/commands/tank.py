@@ -1,55 +1,70 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
+import asyncio
+from modules.autocomplete import autocomplete_monitor
+from modules.cache import TTLCache
+from modules.datastore import DATASETS
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
 logger = get_logger()
 
+# Per-tank ability/agent payloads kept for popular tanks
+TANK_DETAILS_CACHE_SIZE = 64
+TANK_DETAILS_TTL = 600
+
 
 class TankCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.tanks_url = "https://cdn1.heatlabs.net/tanks.json"
+        self.tanks_url = DATASETS["tanks"]
+        self.details_cache = TTLCache(TANK_DETAILS_CACHE_SIZE, TANK_DETAILS_TTL)
 
-    # Fetch JSON data from URL
+    # Fetch JSON data through the shared dataset store
     async def fetch_data(self, url: str):
-        try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    return data
-                logger.warning(
-                    f"Failed to fetch data from {url}: HTTP {response.status}"
-                )
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching data from {url}: {e}")
-            return None
+        return await self.bot.datastore.get(url)
+
+    # Fetch a tank's abilities and agents together, cached per tank
+    async def fetch_tank_details(self, tank) -> tuple:
+        details = self.details_cache.get(tank.name)
+        if details is not None:
+            return details
 
-    # Autocomplete callback for tank names
+        async def fetch(url):
+            return await self.fetch_data(url) if url else None
+
+        abilities_data, agents_data = await asyncio.gather(
+            fetch(tank.abilities_url), fetch(tank.agents_url)
+        )
+        details = (abilities_data, agents_data)
+
+        # Only keep complete results so a failed fetch is retried next time
+        if (abilities_data is not None or not tank.abilities_url) and (
+            agents_data is not None or not tank.agents_url
+        ):
+            self.details_cache.set(tank.name, details)
+        return details
+
+    # Drop cached tank details as soon as tanks.json changes
+    @commands.Cog.listener()
+    async def on_dataset_changed(self, url: str, data):
+        if url == self.tanks_url:
+            self.details_cache.clear()
+
+    # Autocomplete callback for tank names, served from memory only
+    @autocomplete_monitor.timed("tank")
     async def tank_autocomplete(self, interaction: discord.Interaction, current: str):
-        tanks_data = await self.fetch_data(self.tanks_url)
-        if not tanks_data:
+        if not self.bot.datastore.peek(self.tanks_url):
             return []
 
-        tanks = (
-            tanks_data if isinstance(tanks_data, list) else tanks_data.get("tanks", [])
-        )
-        # Filter to only tanks with "Available Now" class
-        available_tanks = [tank for tank in tanks if tank.get("class") == "Available Now"]
-        choices = [tank["name"] for tank in available_tanks]
+        view = await self.bot.views.tanks()
         return [
             app_commands.Choice(name=choice, value=choice)
-            for choice in choices
-            if current.lower() in choice.lower()
-        ][
-            :25
-        ]  # Discord limit
+            for choice in autocomplete_monitor.search(
+                interaction, "tank", "name", view.index, current
+            )
+        ]
 
     @app_commands.command(
         name="tank",
@@ -77,43 +92,49 @@ class TankCommands(commands.Cog):
             return
 
         try:
-            tanks = (
-                tanks_data
-                if isinstance(tanks_data, list)
-                else tanks_data.get("tanks", [])
-            )
+            view = await self.bot.views.tanks()
 
             # Find the tank by name (case-insensitive)
-            tank = next((t for t in tanks if t["name"].lower() == name.lower() and t.get("class") == "Available Now"), None)
+            tank = view.find(name)
+
+            # Fall back to the closest name for typos
+            suggestions = []
+            if not tank:
+                resolved, suggestions = view.index.resolve(name)
+                if resolved:
+                    tank = view.find(resolved)
 
             if not tank:
                 embed = create_embed(command_name="Tank", color="#ff8300")
                 embed.description = f"❌ Tank '{name}' not found or not yet available. Please check the spelling and try again."
+                if suggestions:
+                    embed.description += "\n\n**Did you mean:** " + ", ".join(suggestions)
                 await interaction.followup.send(embed=embed)
                 logger.warning(f"Tank '{name}' not found or not available for {interaction.user}")
                 return
 
-            # Fetch tank-specific abilities and agents
+            # Tank-specific abilities and agents, joined ahead of time when possible
             abilities_data = None
             agents_data = None
 
-            if tank.get("abilities"):
-                abilities_data = await self.fetch_data(tank["abilities"])
-
-            if tank.get("agents"):
-                agents_data = await self.fetch_data(tank["agents"])
+            node = self.bot.graph.get_tank(tank.name)
+            if node is not None:
+                abilities_data = node.abilities
+                agents_data = {"agents": node.agents}
+            else:
+                abilities_data, agents_data = await self.fetch_tank_details(tank)
 
             # Create the main embed
-            embed = create_embed(command_name=f"Tank - {tank['name']}", color="#ff8300")
+            embed = create_embed(command_name=f"Tank - {tank.name}", color="#ff8300")
 
             # Add tank image
-            if tank.get("image"):
-                embed.set_image(url=tank["image"])
+            if tank.image:
+                embed.set_image(url=tank.image)
 
             # Add basic info
-            nation = tank.get("nation", "Unknown")
-            tank_type = tank.get("type", "Unknown")
-            tank_class = tank.get("class", "Unknown")
+            nation = tank.nation or "Unknown"
+            tank_type = tank.type or "Unknown"
+            tank_class = tank.tank_class or "Unknown"
 
             embed.add_field(name="🌍 Nation", value=nation, inline=True)
 
@@ -176,7 +197,7 @@ class TankCommands(commands.Cog):
 
             await interaction.followup.send(embed=embed)
             logger.info(
-                f"Tank command completed successfully for {interaction.user} (Tank: {tank['name']})"
+                f"Tank command completed successfully for {interaction.user} (Tank: {tank.name})"
             )
 
         except Exception as e:
@@ -185,12 +206,6 @@ class TankCommands(commands.Cog):
             embed.description = "⚠️ Error processing tank data. Please try again later."
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("TankCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(TankCommands(bot))
@@ -1,8 +1,7 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
+from modules.datastore import DATASETS
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,22 +14,11 @@ TANK_NATIONS = ["All", "USA", "Germany", "USSR", "UK", "China", "France"]
 class TanksListCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.tanks_url = "https://cdn1.heatlabs.net/tanks.json"
+        self.tanks_url = DATASETS["tanks"]
 
+    # Fetch tanks data through the shared dataset store
     async def fetch_tanks(self):
-        try:
-            async with self.session.get(self.tanks_url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    logger.info("Tanks data fetched successfully")
-                    return data
-                logger.warning(f"Failed to fetch tanks data: HTTP {response.status}")
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching tanks data: {e}")
-            return None
+        return await self.bot.datastore.get(self.tanks_url)
 
     @app_commands.command(
         name="tanks",
@@ -43,14 +31,22 @@ class TanksListCommands(commands.Cog):
     async def tanks(
         self, interaction: discord.Interaction, nation: app_commands.Choice[str] = None
     ) -> None:
-        await interaction.response.defer(thinking=True)
-
         selected_nation = nation.value if nation else "All"
-        embed = create_embed(command_name=f"Tanks - {selected_nation}", color="#ff8300")
         logger.info(
             f"Tanks command invoked by {interaction.user} for nation '{selected_nation}' in guild {interaction.guild.name}"
         )
 
+        # Reuse the rendered embed until tanks.json changes
+        embed = self.bot.embed_cache.get(
+            "tanks", (selected_nation,), url=self.tanks_url
+        )
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name=f"Tanks - {selected_nation}", color="#ff8300")
+
         tanks_data = await self.fetch_tanks()
 
         if not tanks_data:
@@ -62,39 +58,26 @@ class TanksListCommands(commands.Cog):
             return
 
         try:
-            tanks = (
-                tanks_data
-                if isinstance(tanks_data, list)
-                else tanks_data.get("tanks", [])
-            )
-
-            # Filter to only tanks with "Available Now" class
-            available_tanks = [tank for tank in tanks if tank.get("class") == "Available Now"]
+            # Available tanks grouped by nation
+            tanks_by_nation = await self.bot.views.tanks_by_nation()
 
-            if not available_tanks:
+            if not tanks_by_nation:
                 embed.description = "No available tanks found."
                 await interaction.followup.send(embed=embed)
                 return
 
-            # Group tanks by nation
-            tanks_by_nation = {}
-            for tank in available_tanks:
-                nation_name = tank.get("nation", "Unknown")
-                if nation_name not in tanks_by_nation:
-                    tanks_by_nation[nation_name] = []
-                tanks_by_nation[nation_name].append(tank.get("name", "Unknown"))
-
             # Filter by selected nation
             if selected_nation == "All":
                 # Add fields for each nation
-                for nation_name in sorted(tanks_by_nation.keys()):
-                    tank_names = sorted(tanks_by_nation[nation_name])
+                for nation_name, tank_names in tanks_by_nation.items():
                     embed.add_field(
                         name=f"🌍 {nation_name}",
                         value="\n".join(f"• {name}" for name in tank_names),
                         inline=False,
                     )
-                total_tanks = len(available_tanks)
+                total_tanks = sum(
+                    len(tank_names) for tank_names in tanks_by_nation.values()
+                )
             else:
                 # Show only selected nation
                 if selected_nation not in tanks_by_nation:
@@ -102,7 +85,7 @@ class TanksListCommands(commands.Cog):
                     await interaction.followup.send(embed=embed)
                     return
 
-                tank_names = sorted(tanks_by_nation[selected_nation])
+                tank_names = tanks_by_nation[selected_nation]
                 embed.add_field(
                     name=f"🌍 {selected_nation}",
                     value="\n".join(f"• {name}" for name in tank_names),
@@ -116,6 +99,10 @@ class TanksListCommands(commands.Cog):
                 inline=True,
             )
 
+            self.bot.embed_cache.set(
+                "tanks", embed, (selected_nation,), url=self.tanks_url
+            )
+
             await interaction.followup.send(embed=embed)
             logger.info(f"Tanks command completed successfully for {interaction.user}")
 
@@ -126,12 +113,6 @@ class TanksListCommands(commands.Cog):
             )
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("TanksListCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(TanksListCommands(bot))
@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,36 +14,32 @@ class TeamCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/team.json"
 
-    # Load team members from JSON file
-    def load_team(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Team data loaded successfully")
-                return data.get("members", [])
-            else:
-                logger.warning(
-                    f"Failed to fetch team members: HTTP {response.status_code}"
-                )
-                return []
-        except Exception as e:
-            logger.error(f"Error loading team: {e}")
+    # Load team members through the shared dataset store
+    async def load_team(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("members", [])
 
     @app_commands.command(
         name="team",
         description="View the HEAT Labs team members and their roles",
     )
     async def team(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Team", color="#ff8300")
         logger.info(
             f"Team command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        members = self.load_team()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("team", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Team", color="#ff8300")
+
+        members = await self.load_team()
 
         if not members:
             embed.description = "⚠️ Failed to load team data. Please try again later."
@@ -64,6 +59,7 @@ class TeamCommands(commands.Cog):
                 team_text.append(f"• **{member_name}** - {member_description}")
 
             embed.description = "\n".join(team_text)
+            self.bot.embed_cache.set("team", embed, url=self.config_file)
             await interaction.followup.send(embed=embed)
             logger.info(f"Team command completed successfully for {interaction.user}")
 
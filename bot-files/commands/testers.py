@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,34 +14,32 @@ class TesterCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/testers.json"
 
-    # Load testers from JSON file
-    def load_tester(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Tester data loaded successfully")
-                return data.get("testers", [])
-            else:
-                logger.warning(f"Failed to fetch testers: HTTP {response.status_code}")
-                return []
-        except Exception as e:
-            logger.error(f"Error loading testers: {e}")
+    # Load testers through the shared dataset store
+    async def load_tester(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("testers", [])
 
     @app_commands.command(
         name="testers",
         description="View all HEAT Labs testers",
     )
     async def testers(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="Testers", color="#ff8300")
         logger.info(
             f"Testers command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        members = self.load_tester()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("testers", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="Testers", color="#ff8300")
+
+        members = await self.load_tester()
 
         if not members:
             embed.description = (
@@ -64,6 +61,7 @@ class TesterCommands(commands.Cog):
                 tester_text.append(f"• **{member_name}** - {member_description}")
 
             embed.description = "\n".join(tester_text)
+            self.bot.embed_cache.set("testers", embed, url=self.config_file)
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"Testers command completed successfully for {interaction.user}"
@@ -1,11 +1,12 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
+from modules.autocomplete import autocomplete_monitor
 from datetime import datetime
 from modules.embeds import create_embed
+from modules.index import NameIndex
 from modules.logger import get_logger
+from modules.models import find_by_name, parse_tournaments
 
 logger = get_logger()
 
@@ -13,23 +14,21 @@ logger = get_logger()
 class TournamentCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.tournaments_url = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/tournaments.json"
 
+    # Fetch data through the shared dataset store
     async def fetch_data(self, url: str):
-        try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    return data
-                logger.warning(
-                    f"Failed to fetch data from {url}: HTTP {response.status}"
-                )
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching data from {url}: {e}")
-            return None
+        return await self.bot.datastore.get(url)
+
+    # Read the tournament list from the local config
+    async def fetch_tournaments(self):
+        return await self.bot.config.get("tournaments")
+
+    # Tournament models, parsed once per tournaments.json version
+    def get_tournaments(self) -> tuple:
+        return (
+            self.bot.config.derive("tournaments", "tournaments", parse_tournaments)
+            or ()
+        )
 
     # Format date string to a more readable format (22 Feb. 2025)
     def format_date(self, date_string: str) -> str:
@@ -56,20 +55,27 @@ class TournamentCommands(commands.Cog):
         except (ValueError, AttributeError):
             return datetime_string  # Return original if parsing fails
 
-    # Autocomplete callback for tank names
+    # Name index of published tournaments, rebuilt once per tournaments.json version
+    def build_tournament_index(self, tournaments_data) -> NameIndex:
+        return NameIndex([t.name for t in self.get_tournaments() if t.published])
+
+    # Autocomplete callback for tournament names, served from memory only
+    @autocomplete_monitor.timed("tournament")
     async def tournament_autocomplete(
         self, interaction: discord.Interaction, current: str
     ):
-        tournaments_data = await self.fetch_data(self.tournaments_url)
-        if not tournaments_data:
+        if not self.bot.config.peek("tournaments"):
             return []
 
-        choices = [t["name"] for t in tournaments_data if t.get("publish")]
+        index = self.bot.config.derive(
+            "tournaments", "tournament_index", self.build_tournament_index
+        )
         return [
             app_commands.Choice(name=choice, value=choice)
-            for choice in choices
-            if current.lower() in choice.lower()
-        ][:25]
+            for choice in autocomplete_monitor.search(
+                interaction, "tournament", "name", index, current
+            )
+        ]
 
     @app_commands.command(
         name="tournament",
@@ -84,7 +90,7 @@ class TournamentCommands(commands.Cog):
             f"Tournament command invoked by {interaction.user} for tournament '{name}' in guild {interaction.guild.name}"
         )
 
-        tournaments_data = await self.fetch_data(self.tournaments_url)
+        tournaments_data = await self.fetch_tournaments()
 
         if not tournaments_data:
             embed = create_embed(command_name="Tournament", color="#ff8300")
@@ -98,18 +104,29 @@ class TournamentCommands(commands.Cog):
             return
 
         try:
-            tournament = next(
-                (t for t in tournaments_data if t["name"].lower() == name.lower()), None
-            )
+            tournaments = self.get_tournaments()
+            tournament = find_by_name(tournaments, name)
+
+            # Fall back to the closest name for typos
+            suggestions = []
+            if not tournament:
+                index = self.bot.config.derive(
+                    "tournaments", "tournament_index", self.build_tournament_index
+                )
+                resolved, suggestions = index.resolve(name)
+                if resolved:
+                    tournament = find_by_name(tournaments, resolved)
 
             if not tournament:
                 embed = create_embed(command_name="Tournament", color="#ff8300")
                 embed.description = f"❌ Tournament '{name}' not found. Please check the spelling and try again."
+                if suggestions:
+                    embed.description += "\n\n**Did you mean:** " + ", ".join(suggestions)
                 await interaction.followup.send(embed=embed)
                 logger.warning(f"Tournament '{name}' not found for {interaction.user}")
                 return
 
-            tournament_data = await self.fetch_data(tournament["tournament-data"])
+            tournament_data = await self.fetch_data(tournament.data_url)
 
             if not tournament_data:
                 embed = create_embed(command_name="Tournament", color="#ff8300")
@@ -123,31 +140,31 @@ class TournamentCommands(commands.Cog):
                 return
 
             embed = create_embed(
-                command_name=f"Tournament - {tournament['name']}", color="#ff8300"
+                command_name=f"Tournament - {tournament.name}", color="#ff8300"
             )
 
-            if tournament.get("image"):
-                embed.set_image(url=tournament["image"])
+            if tournament.image:
+                embed.set_image(url=tournament.image)
 
             embed.add_field(
                 name="📝 Description",
-                value=tournament.get("description", "No description available."),
+                value=tournament.description or "No description available.",
                 inline=False,
             )
 
             # Use formatted dates
-            formatted_date = self.format_date(tournament.get("date", "Unknown"))
-            formatted_start = self.format_datetime(tournament.get("start", "Unknown"))
-            formatted_end = self.format_datetime(tournament.get("end", "Unknown"))
+            formatted_date = self.format_date(tournament.date or "Unknown")
+            formatted_start = self.format_datetime(tournament.start or "Unknown")
+            formatted_end = self.format_datetime(tournament.end or "Unknown")
 
             embed.add_field(name="📅 Date", value=formatted_date, inline=True)
             embed.add_field(name="🕐 Start", value=formatted_start, inline=True)
             embed.add_field(name="🕔 End", value=formatted_end, inline=True)
             embed.add_field(
-                name="🎮 Mode", value=tournament.get("mode", "Unknown"), inline=True
+                name="🎮 Mode", value=tournament.mode or "Unknown", inline=True
             )
             embed.add_field(
-                name="📊 Status", value=tournament.get("type", "Unknown"), inline=True
+                name="📊 Status", value=tournament.type or "Unknown", inline=True
             )
 
             total_teams = tournament_data.get("total_teams", "Unknown")
@@ -192,7 +209,7 @@ class TournamentCommands(commands.Cog):
 
             await interaction.followup.send(embed=embed)
             logger.info(
-                f"Tournament command completed successfully for {interaction.user} (Tournament: {tournament['name']})"
+                f"Tournament command completed successfully for {interaction.user} (Tournament: {tournament.name})"
             )
 
         except Exception as e:
@@ -205,12 +222,6 @@ class TournamentCommands(commands.Cog):
             )
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("TournamentCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(TournamentCommands(bot))
@@ -1,8 +1,6 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
-import json
 from datetime import datetime
 from modules.embeds import create_embed
 from modules.logger import get_logger
@@ -13,24 +11,10 @@ logger = get_logger()
 class TournamentsListCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-        self.tournaments_url = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/tournaments.json"
 
+    # Read the tournament list from the local config
     async def fetch_tournaments(self):
-        try:
-            async with self.session.get(self.tournaments_url) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    data = json.loads(text)
-                    logger.info("Tournaments data fetched successfully")
-                    return data
-                logger.warning(
-                    f"Failed to fetch tournaments data: HTTP {response.status}"
-                )
-                return None
-        except Exception as e:
-            logger.error(f"Error fetching tournaments data: {e}")
-            return None
+        return await self.bot.config.get("tournaments")
 
     # Format date string to a more readable format (22 Feb. 2025)
     def format_date(self, date_string: str) -> str:
@@ -128,12 +112,6 @@ class TournamentsListCommands(commands.Cog):
             )
             await interaction.followup.send(embed=embed)
 
-    def cog_unload(self) -> None:
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("TournamentsListCommands cog unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(TournamentsListCommands(bot))
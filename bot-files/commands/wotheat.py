@@ -3,7 +3,6 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
-import requests
 from modules.embeds import create_embed
 from modules.logger import get_logger
 
@@ -15,36 +14,32 @@ class WotHeatCommands(commands.Cog):
         self.bot = bot
         self.config_file = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config/wotheat.json"
 
-    # Load WoT HEAT pages from JSON file
-    def load_wotheat_pages(self) -> list:
-        try:
-            response = requests.get(self.config_file)
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("WoT: HEAT pages data loaded successfully")
-                return data.get("wotheat", [])
-            else:
-                logger.warning(
-                    f"Failed to fetch WoT: HEAT pages: HTTP {response.status_code}"
-                )
-                return []
-        except Exception as e:
-            logger.error(f"Error loading WoT: HEAT pages: {e}")
+    # Load WoT HEAT pages through the shared dataset store
+    async def load_wotheat_pages(self) -> list:
+        data = await self.bot.datastore.get(self.config_file)
+        if not data:
             return []
+        return data.get("wotheat", [])
 
     @app_commands.command(
         name="wotheat",
         description="View all official World of Tanks: HEAT store pages and social media",
     )
     async def wotheat(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(thinking=True)
-
-        embed = create_embed(command_name="World of Tanks: HEAT", color="#ff8300")
         logger.info(
             f"WoT: HEAT command invoked by {interaction.user} in guild {interaction.guild.name}"
         )
 
-        wotheat_pages = self.load_wotheat_pages()
+        # Reuse the rendered embed until the data behind it changes
+        embed = self.bot.embed_cache.get("wotheat", url=self.config_file)
+        if embed is not None:
+            await interaction.response.send_message(embed=embed)
+            return
+
+        await interaction.response.defer(thinking=True)
+        embed = create_embed(command_name="World of Tanks: HEAT", color="#ff8300")
+
+        wotheat_pages = await self.load_wotheat_pages()
 
         if not wotheat_pages:
             embed.description = "⚠️ Failed to load World of Tanks: HEAT pages data. Please try again later."
@@ -71,6 +66,8 @@ class WotHeatCommands(commands.Cog):
                     inline=False,
                 )
 
+            self.bot.embed_cache.set("wotheat", embed, url=self.config_file)
+
             await interaction.followup.send(embed=embed)
             logger.info(
                 f"WoT: HEAT command completed successfully for {interaction.user}"
@@ -6,6 +6,14 @@ import traceback
 from dotenv import load_dotenv
 from modules.logger import get_logger
 from modules.cooldown import global_cooldown
+from modules.config import ConfigLoader
+from modules.datastore import DatasetStore
+from modules.embed_cache import EmbedCache
+from modules.graph import CrossReferenceGraph
+from modules.http_client import HTTPClient
+from modules.scheduler import RefreshScheduler
+from modules.views import DatasetViews
+from modules.workers import WorkerPool
 from modules.embeds import create_embed, add_embed_footer
 
 # Load environment variables
@@ -16,9 +24,9 @@ logger = get_logger()
 
 
 class ShardMonitor:
-    def __init__(self):
+    def __init__(self, http_client):
         self.webhook_url = os.getenv("SHARD_WEBHOOK")
-        self.session = None
+        self.http_client = http_client
         self.last_embed_time = {}
 
         if not self.webhook_url:
@@ -30,12 +38,6 @@ class ShardMonitor:
             self.monitoring_enabled = True
             logger.info("Shard monitor initialized")
 
-    async def initialize(self):
-        if self.monitoring_enabled:
-            import aiohttp
-
-            self.session = aiohttp.ClientSession()
-
     async def send_shard_embed(
         self,
         title: str,
@@ -45,7 +47,7 @@ class ShardMonitor:
         fields: list = None,
         is_summary: bool = False,
     ):
-        if not self.monitoring_enabled or not self.session:
+        if not self.monitoring_enabled:
             return
 
         # 1 second delay between embeds for the same shard
@@ -94,21 +96,15 @@ class ShardMonitor:
             }
 
             # Send to webhook
-            async with self.session.post(self.webhook_url, json=data) as response:
-                if response.status in (200, 204):
-                    logger.debug(f"Shard webhook sent: {title} for shard {shard_id}")
-                else:
-                    logger.warning(
-                        f"Failed to send shard webhook: HTTP {response.status}"
-                    )
+            response = await self.http_client.post(self.webhook_url, json=data)
+            if response.status in (200, 204):
+                logger.debug(f"Shard webhook sent: {title} for shard {shard_id}")
+            else:
+                logger.warning(f"Failed to send shard webhook: HTTP {response.status}")
 
         except Exception as e:
             logger.error(f"Error sending shard webhook: {e}")
 
-    async def close(self):
-        if self.session:
-            await self.session.close()
-
 
 class HEATLabsBot(commands.AutoShardedBot):
     def __init__(self):
@@ -125,8 +121,34 @@ class HEATLabsBot(commands.AutoShardedBot):
         # Check global cooldown
         self.tree.interaction_check = global_cooldown.interaction_check
 
+        # Initialize shared HTTP client
+        self.http_client = HTTPClient()
+
         # Initialize shard monitor
-        self.shard_monitor = ShardMonitor()
+        self.shard_monitor = ShardMonitor(self.http_client)
+
+        # Initialize worker pool for parsing and index building
+        self.workers = WorkerPool()
+
+        # Initialize shared dataset cache
+        self.datastore = DatasetStore(self.http_client, self.dispatch, self.workers)
+        self.refresh_scheduler = RefreshScheduler(self.datastore)
+
+        # Initialize filtered dataset views
+        self.views = DatasetViews(self.datastore)
+        self.add_listener(self.views.on_dataset_changed, "on_dataset_changed")
+
+        # Initialize tank/agent cross-reference graph
+        self.graph = CrossReferenceGraph(self.datastore, self.views)
+        self.add_listener(self.graph.on_dataset_changed, "on_dataset_changed")
+
+        # Initialize rendered embed cache
+        self.embed_cache = EmbedCache(self.datastore)
+
+        # Initialize local config loader
+        self.config = ConfigLoader(
+            self.datastore, dispatch=self.dispatch, scheduler=self.refresh_scheduler
+        )
 
         # Hourly update task
         self.hourly_update_task = None
@@ -135,8 +157,14 @@ class HEATLabsBot(commands.AutoShardedBot):
 
     # Load all command modules
     async def setup_hook(self):
-        # Initialize shard monitor session
-        await self.shard_monitor.initialize()
+        # Initialize shared HTTP session
+        await self.http_client.initialize()
+
+        # Restore datasets from disk before touching the network
+        self.datastore.load_snapshots()
+
+        # Read shipped config files into memory
+        self.config.load_all()
 
         # Start hourly update task
         self.hourly_update_task = asyncio.create_task(self.hourly_member_count_update())
@@ -165,6 +193,14 @@ class HEATLabsBot(commands.AutoShardedBot):
                     logger.error(f"Failed to load {module_name}: {e}")
                     failed.append((module_name, str(e)))
 
+        # Warm the dataset cache before the first command arrives
+        await self.datastore.prewarm()
+        self.graph.schedule_rebuild()
+
+        # Keep datasets fresh in the background from now on
+        self.refresh_scheduler.start()
+        self.config.start()
+
         await self.tree.sync()
         logger.info(
             f"Commands synced with Discord ({len(loaded)} loaded, {len(failed)} failed)"
@@ -504,8 +540,15 @@ class HEATLabsBot(commands.AutoShardedBot):
             except asyncio.CancelledError:
                 logger.info("Hourly update task cancelled")
 
-        # Close shard monitor session
-        await self.shard_monitor.close()
+        # Stop dataset refreshes
+        await self.refresh_scheduler.stop()
+        await self.config.stop()
+        await self.graph.close()
+        await self.datastore.close()
+        self.workers.close()
+
+        # Close shared HTTP session
+        await self.http_client.close()
 
         # Call parent close method
         await super().close()
@@ -0,0 +1,140 @@
+import functools
+import os
+import time
+from collections import OrderedDict
+from modules.logger import get_logger
+
+logger = get_logger()
+
+# Discord drops autocomplete responses after 3 seconds, stay well inside that
+AUTOCOMPLETE_BUDGET_MS = float(os.getenv("AUTOCOMPLETE_BUDGET_MS", "250"))
+
+# Discord limit on autocomplete choices
+MAX_CHOICES = 25
+
+# How long a user's last query is kept for narrowing, and how many users are tracked
+NARROWING_TTL = 30
+NARROWING_MAX_ENTRIES = 1000
+
+
+# Latency and outcome counters for a single autocomplete callback
+class AutocompleteStats:
+    __slots__ = (
+        "calls",
+        "empty",
+        "narrowed",
+        "over_budget",
+        "errors",
+        "total_ms",
+        "max_ms",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.empty = 0
+        self.narrowed = 0
+        self.over_budget = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, results: int):
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if not results:
+            self.empty += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "empty": self.empty,
+            "narrowed": self.narrowed,
+            "over_budget": self.over_budget,
+            "errors": self.errors,
+            "avg_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "max_ms": self.max_ms,
+        }
+
+
+# Measures every autocomplete keystroke against a time budget
+class AutocompleteMonitor:
+    def __init__(self):
+        self.budget = AUTOCOMPLETE_BUDGET_MS / 1000
+        self.stats = {}
+
+        # (user, command, option) -> (index, search state, expiry), least recently used first
+        self.narrowing = OrderedDict()
+        logger.info(f"Autocomplete budget set to {AUTOCOMPLETE_BUDGET_MS:.0f}ms")
+
+    def _get_stats(self, name: str) -> AutocompleteStats:
+        if name not in self.stats:
+            self.stats[name] = AutocompleteStats()
+        return self.stats[name]
+
+    # Wrap an autocomplete callback to time it and count budget overruns.
+    # The budget itself is enforced by the deadline search() passes to the index
+    def timed(self, name: str):
+        def decorator(callback):
+            @functools.wraps(callback)
+            async def wrapper(*args):
+                stats = self._get_stats(name)
+                start = time.perf_counter()
+                try:
+                    choices = await callback(*args)
+                except Exception as e:
+                    stats.errors += 1
+                    logger.error(f"Error in {name} autocomplete: {e}")
+                    choices = []
+
+                elapsed = time.perf_counter() - start
+                if elapsed > self.budget:
+                    stats.over_budget += 1
+                stats.record(elapsed * 1000, len(choices))
+                return choices
+
+            return wrapper
+
+        return decorator
+
+    # Search a name index, narrowing from the user's previous keystroke when it still applies
+    def search(
+        self,
+        interaction,
+        command: str,
+        option: str,
+        index,
+        current: str,
+    ) -> list:
+        key = (interaction.user.id, command, option)
+        now = time.monotonic()
+
+        previous = None
+        cached = self.narrowing.pop(key, None)
+        if cached and cached[0] is index and cached[2] > now:
+            previous = cached[1]
+
+        names, state = index.narrow(previous, current, deadline=self.deadline())
+        if previous is not None and state is not None:
+            if state.query.startswith(previous.query):
+                self._get_stats(command).narrowed += 1
+
+        # Remember this query for the next keystroke, evicting the oldest users
+        if state is not None:
+            self.narrowing[key] = (index, state, now + NARROWING_TTL)
+            while len(self.narrowing) > NARROWING_MAX_ENTRIES:
+                self.narrowing.popitem(last=False)
+
+        return names
+
+    # Deadline for work that started now
+    def deadline(self) -> float:
+        return time.perf_counter() + self.budget
+
+    # Get per-callback latency metrics
+    def get_stats(self) -> dict:
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+
+# Global instance
+autocomplete_monitor = AutocompleteMonitor()
@@ -0,0 +1,85 @@
+import time
+from modules.logger import get_logger
+
+logger = get_logger()
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+# Per-host circuit breaker with exponential backoff and half-open probes
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        base_backoff: float = 5.0,
+        max_backoff: float = 300.0,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.probe_in_flight = False
+
+    # Current backoff, doubled every time the breaker re-opens
+    def _backoff(self) -> float:
+        return min(self.base_backoff * (2 ** max(self.trips - 1, 0)), self.max_backoff)
+
+    # Check whether a request to this host may go out right now
+    def allow_request(self) -> bool:
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN:
+            if time.monotonic() < self.open_until:
+                return False
+            # Backoff elapsed, let a single probe through
+            self.state = HALF_OPEN
+            self.probe_in_flight = False
+            logger.info(f"Circuit breaker for {self.name} is half-open, probing")
+
+        if self.probe_in_flight:
+            return False
+
+        self.probe_in_flight = True
+        return True
+
+    def record_success(self):
+        if self.state != CLOSED:
+            logger.info(f"Circuit breaker for {self.name} closed")
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probe_in_flight = False
+
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trips += 1
+            self.state = OPEN
+            self.open_until = time.monotonic() + self._backoff()
+            logger.warning(
+                f"Circuit breaker for {self.name} opened for {self._backoff():.0f}s "
+                f"after {self.failures} consecutive failures"
+            )
+
+    # Get breaker state for diagnostics
+    def get_state(self) -> dict:
+        retry_in = max(self.open_until - time.monotonic(), 0)
+        return {
+            "name": self.name,
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "retry_in": retry_in if self.state == OPEN else 0,
+        }
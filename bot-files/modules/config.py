@@ -0,0 +1,211 @@
+import asyncio
+import json
+import os
+from modules.logger import get_logger
+
+logger = get_logger()
+
+# Config files shipped in bot-files/config/ that commands read on every call
+CONFIG_FILES = ["help", "tournaments"]
+
+# Refresh interval for config files served from their remote copy, in seconds
+REMOTE_REFRESH_INTERVALS = {
+    "help": 1800,
+    "tournaments": 900,
+}
+
+# Upstream copy of the config directory, used for background sync
+REMOTE_CONFIG_BASE = "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/config"
+
+# Synced copies are kept here so the tracked config files are never rewritten
+SYNC_DIR = os.path.join("snapshots", "config")
+
+
+# A config file held in memory
+class ConfigEntry:
+    __slots__ = ("data", "path", "mtime_ns", "size")
+
+    def __init__(self, data, path: str, mtime_ns: int, size: int):
+        self.data = data
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+    # Version key, changes whenever the file on disk is rewritten
+    @property
+    def version(self) -> str:
+        return f"{self.mtime_ns}:{self.size}"
+
+
+# Serves local config files from memory, re-reading only when they change on disk
+class ConfigLoader:
+    def __init__(
+        self,
+        datastore,
+        config_dir: str = "config",
+        dispatch=None,
+        scheduler=None,
+        sync_dir: str = SYNC_DIR,
+    ):
+        self.datastore = datastore
+        self.config_dir = config_dir
+        self.sync_dir = sync_dir
+        self.dispatch = dispatch
+        self.scheduler = scheduler
+        self.prefetch_tasks = set()
+        self.entries = {}
+        self.derived = {}
+        self.sync_interval = int(os.getenv("CONFIG_SYNC_INTERVAL", "0"))
+        self.sync_task = None
+
+    def _get_synced_path(self, name: str) -> str:
+        return os.path.join(self.sync_dir, f"{name}.json")
+
+    # The synced copy wins over the shipped file, but only while sync is enabled
+    def _get_local_path(self, name: str) -> str:
+        if self.sync_interval > 0:
+            synced_path = self._get_synced_path(name)
+            if os.path.exists(synced_path):
+                return synced_path
+        return os.path.join(self.config_dir, f"{name}.json")
+
+    def _get_remote_url(self, name: str) -> str:
+        return f"{REMOTE_CONFIG_BASE}/{name}.json"
+
+    # Return the in-memory copy, re-reading the file if its mtime changed
+    def _load_local(self, name: str):
+        path = self._get_local_path(name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        entry = self.entries.get(name)
+        if (
+            entry
+            and entry.path == path
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+        ):
+            return entry
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Error reading config {path}: {e}")
+            # Keep serving the last good copy
+            return entry
+
+        new_entry = ConfigEntry(data, path, stat.st_mtime_ns, stat.st_size)
+        self.entries[name] = new_entry
+        self.derived = {k: v for k, v in self.derived.items() if k[0] != name}
+
+        if entry is not None:
+            logger.info(f"Config {name} reloaded from disk")
+            if self.dispatch:
+                self.dispatch("config_changed", name, data)
+        return new_entry
+
+    # Get a config file, falling back to the remote copy when it isn't shipped locally
+    async def get(self, name: str):
+        entry = self._load_local(name)
+        if entry is not None:
+            return entry.data
+        return await self.datastore.get(self._get_remote_url(name))
+
+    # Get a config file without waiting on the network
+    def peek(self, name: str):
+        entry = self._load_local(name)
+        if entry is not None:
+            return entry.data
+        return self.datastore.peek(self._get_remote_url(name))
+
+    # Version of a config file, changes whenever its content is reloaded
+    def get_version(self, name: str) -> str:
+        entry = self._load_local(name)
+        if entry is not None:
+            return entry.version
+        return self.datastore.get_version(self._get_remote_url(name))
+
+    # Build a structure from a loaded config file once per version
+    def derive(self, name: str, key: str, builder):
+        entry = self._load_local(name)
+        if entry is None:
+            return self.datastore.derive(self._get_remote_url(name), key, builder)
+
+        cached = self.derived.get((name, key))
+        if cached and cached[0] == entry.version:
+            return cached[1]
+
+        value = builder(entry.data)
+        self.derived[(name, key)] = (entry.version, value)
+        return value
+
+    # Read every config file into memory, prefetching the ones only available remotely
+    def load_all(self) -> int:
+        loaded = 0
+        for name in CONFIG_FILES:
+            if self._load_local(name) is not None:
+                loaded += 1
+                continue
+
+            logger.warning(f"Config {name}.json not found locally, using remote copy")
+            url = self._get_remote_url(name)
+            if self.scheduler:
+                self.scheduler.add(name, url, REMOTE_REFRESH_INTERVALS[name])
+
+            task = asyncio.ensure_future(self.datastore.get(url))
+            self.prefetch_tasks.add(task)
+            task.add_done_callback(self.prefetch_tasks.discard)
+        logger.info(f"Loaded {loaded}/{len(CONFIG_FILES)} config files from disk")
+        return loaded
+
+    def start(self):
+        if self.sync_interval <= 0 or self.sync_task is not None:
+            return
+        self.sync_task = asyncio.create_task(self._sync_loop())
+        logger.info(f"Config sync started every {self.sync_interval} seconds")
+
+    async def stop(self):
+        if self.sync_task is None:
+            return
+        self.sync_task.cancel()
+        await asyncio.gather(self.sync_task, return_exceptions=True)
+        self.sync_task = None
+
+    async def _sync_loop(self):
+        while True:
+            for name in CONFIG_FILES:
+                try:
+                    await self.sync(name)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error syncing config {name}: {e}")
+            await asyncio.sleep(self.sync_interval)
+
+    # Pull the remote copy and save it if it differs from the file in use
+    async def sync(self, name: str) -> bool:
+        url = self._get_remote_url(name)
+        await self.datastore.refresh(url)
+        data = await self.datastore.get(url)
+        if data is None:
+            return False
+
+        entry = self._load_local(name)
+        if entry is not None and entry.data == data:
+            return False
+
+        path = self._get_synced_path(name)
+        await asyncio.to_thread(self._write_local, path, data)
+        self._load_local(name)
+        logger.info(f"Config {name} synced from remote")
+        return True
+
+    def _write_local(self, path: str, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
@@ -0,0 +1,474 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlparse
+from modules.circuit import CircuitBreaker
+from modules.logger import daily_logger, get_logger
+from modules.record_store import RecordStore
+from modules.snapshots import SnapshotStore
+
+logger = get_logger()
+
+# Datasets used by the cogs, prefetched at startup
+DATASETS = {
+    "tanks": "https://cdn1.heatlabs.net/tanks.json",
+    "maps": "https://cdn1.heatlabs.net/maps.json",
+    "agents": "https://cdn1.heatlabs.net/agents.json",
+    "player-records": "https://cdn1.heatlabs.net/player-records.json",
+    "memes": "https://cdn1.heatlabs.net/memes.json",
+    "home-stats": "https://cdn1.heatlabs.net/home-stats.json",
+    "changelog": "https://cdn1.heatlabs.net/changelog.json",
+    "game-builds": "https://cdn1.heatlabs.net/game_builds.json",
+}
+
+# Datasets streamed into a compact in-memory form instead of the parsed JSON tree
+DATASET_LOADERS = {
+    DATASETS["player-records"]: RecordStore,
+}
+
+
+# A single cached dataset payload
+class CacheEntry:
+    __slots__ = (
+        "data",
+        "size",
+        "etag",
+        "last_modified",
+        "content_hash",
+        "fetched_at",
+        "expires_at",
+    )
+
+    def __init__(
+        self,
+        data,
+        size: int,
+        ttl: float,
+        etag: str = None,
+        last_modified: str = None,
+        content_hash: str = None,
+        age: float = 0.0,
+    ):
+        self.data = data
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.touch(ttl, age)
+
+    # Mark the entry as validated age seconds ago
+    def touch(self, ttl: float, age: float = 0.0):
+        self.fetched_at = time.monotonic() - age
+        self.expires_at = self.fetched_at + ttl
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    # Build conditional request headers from the stored validators
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# Bot-wide in-memory cache for the JSON datasets served from the CDN
+class DatasetStore:
+    def __init__(self, http_client, dispatch=None, workers=None):
+        self.http_client = http_client
+        self.dispatch = dispatch
+        self.workers = workers
+        self.default_ttl = int(
+            os.getenv("DATASET_TTL", "300")
+        )  # Fallback to 5 minutes
+        self.entries = {}
+        self.inflight = {}
+        self.ttls = {}
+        self.breakers = {}
+        self.read_counts = {}
+        self.derived = {}
+        self.building = {}
+        self.loaders = dict(DATASET_LOADERS)
+        self.snapshots = SnapshotStore()
+        self.background_tasks = set()
+
+        # Counters exposed through get_stats()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.fetches = 0
+        self.not_modified = 0
+        self.failures = 0
+        self.short_circuited = 0
+
+        logger.info(f"Dataset store initialized with {self.default_ttl} second TTL")
+
+    # Override the cache lifetime for a single URL
+    def set_ttl(self, url: str, ttl: float):
+        self.ttls[url] = ttl
+
+    # Get a dataset, fetching it only when there is no cached copy at all
+    async def get(self, url: str):
+        if url in self.entries:
+            return self.peek(url)
+
+        self.read_counts[url] = self.read_counts.get(url, 0) + 1
+        self.misses += 1
+        task = self._start_fetch(url)
+
+        # Shield so a cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    # Get a cached dataset without waiting, a miss starts a background load
+    def peek(self, url: str):
+        self.read_counts[url] = self.read_counts.get(url, 0) + 1
+        entry = self.entries.get(url)
+        if entry is None:
+            self.misses += 1
+            self._start_fetch(url)
+            return None
+
+        if entry.is_fresh():
+            self.hits += 1
+        else:
+            # Serve the last good payload while a refresh runs
+            self.stale_hits += 1
+            self._start_fetch(url)
+        return entry.data
+
+    # Start a fetch for a URL, or join the one already in flight
+    def _start_fetch(self, url: str) -> asyncio.Future:
+        task = self.inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url))
+            self.inflight[url] = task
+        else:
+            self.coalesced += 1
+        return task
+
+    # Revalidate a dataset now, returning True when its content changed
+    async def refresh(self, url: str) -> bool:
+        previous = self.entries.get(url)
+        await asyncio.shield(self._start_fetch(url))
+        current = self.entries.get(url)
+        return current is not None and current is not previous
+
+    # Number of times a dataset has been read
+    def get_read_count(self, url: str) -> int:
+        return self.read_counts.get(url, 0)
+
+    # Drop a cached dataset so the next get() refetches it
+    def invalidate(self, url: str):
+        self.entries.pop(url, None)
+
+    # Drop structures built from the old version and notify listeners
+    def _on_dataset_changed(self, url: str, data):
+        for key in [key for key in self.derived if key[0] == url]:
+            del self.derived[key]
+
+        logger.info(f"Dataset changed: {url}")
+        if self.dispatch:
+            self.dispatch("dataset_changed", url, data)
+
+    # Content hash of the cached copy of a dataset
+    def get_version(self, url: str) -> str:
+        entry = self.entries.get(url)
+        return entry.content_hash if entry else None
+
+    # Build a structure from a cached dataset once per content version
+    def derive(self, url: str, key: str, builder):
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+
+        cached = self.derived.get((url, key))
+        if cached and cached[0] == entry.content_hash:
+            return cached[1]
+
+        value = builder(entry.data)
+        self.derived[(url, key)] = (entry.content_hash, value)
+        return value
+
+    # Like derive(), but the builder runs on a worker thread instead of the event loop
+    async def derive_async(self, url: str, key: str, builder):
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+
+        version = entry.content_hash
+        cached = self.derived.get((url, key))
+        if cached and cached[0] == version:
+            return cached[1]
+
+        # Callers waiting on the same version share one build
+        task = self.building.get((url, key, version))
+        if task is None:
+            task = asyncio.ensure_future(
+                self._build(url, key, version, builder, entry.data)
+            )
+            self.building[(url, key, version)] = task
+        return await asyncio.shield(task)
+
+    async def _build(self, url: str, key: str, version: str, builder, data):
+        try:
+            value = await self._run(key, builder, data)
+            # A newer version may have arrived while this one was building
+            if self.get_version(url) == version:
+                self.derived[(url, key)] = (version, value)
+            return value
+        finally:
+            self.building.pop((url, key, version), None)
+
+    # Run CPU-bound work on the worker pool when the bot has one
+    async def _run(self, name: str, function, *args, size: int = 0):
+        if self.workers is None:
+            return function(*args)
+        return await self.workers.run(name, function, *args, size=size)
+
+    # Run a background coroutine, keeping a reference until it finishes
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
+
+    # Load the last good copy of every dataset from disk before any network access
+    def load_snapshots(self) -> int:
+        start = time.perf_counter()
+        now = time.time()
+        loaded = 0
+
+        for snapshot in self.snapshots.load_all():
+            url = snapshot["url"]
+            if url in self.entries:
+                continue
+
+            loader = self.loaders.get(url)
+            data = snapshot["data"]
+            self.entries[url] = CacheEntry(
+                loader.from_snapshot(data) if loader else data,
+                snapshot["size"],
+                self.ttls.get(url, self.default_ttl),
+                snapshot["etag"],
+                snapshot["last_modified"],
+                snapshot["content_hash"],
+                age=max(now - snapshot["saved_at"], 0),
+            )
+            loaded += 1
+
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.info(f"Loaded {loaded} dataset snapshots in {elapsed:.1f}ms")
+        return loaded
+
+    # Get the circuit breaker guarding a URL's host
+    def _get_breaker(self, url: str) -> CircuitBreaker:
+        host = urlparse(url).netloc
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(host)
+        return self.breakers[host]
+
+    async def _fetch(self, url: str):
+        entry = self.entries.get(url)
+        fallback = entry.data if entry else None
+        breaker = self._get_breaker(url)
+
+        try:
+            # Don't hammer a host that keeps failing
+            if not breaker.allow_request():
+                self.short_circuited += 1
+                logger.debug(f"Circuit open, skipping fetch: {url}")
+                return fallback
+
+            self.fetches += 1
+            start = time.perf_counter()
+            ttl = self.ttls.get(url, self.default_ttl)
+
+            # Revalidate an expired copy instead of downloading it again
+            headers = entry.conditional_headers() if entry else {}
+
+            # Large datasets are parsed while they download, never held whole
+            loader = self.loaders.get(url)
+            if loader is not None:
+                parser = loader.stream_parser()
+                digest = hashlib.blake2b(digest_size=16)
+                parse_errors = []
+
+                # Each chunk is parsed on a worker thread before the next is read.
+                # A malformed body is this dataset's problem, not a failure of the host
+                async def consume(chunk: bytes):
+                    digest.update(chunk)
+                    if parse_errors:
+                        return
+                    try:
+                        await self._run("stream", parser.feed, chunk)
+                    except ValueError as e:
+                        parse_errors.append(e)
+
+                response = await self.http_client.stream(
+                    url, consume, headers=headers
+                )
+            else:
+                response = await self.http_client.get(url, headers=headers)
+
+            if response.status == 304 and entry:
+                breaker.record_success()
+                self.not_modified += 1
+                entry.touch(ttl)
+                logger.debug(f"Dataset not modified, revalidated: {url}")
+                return entry.data
+
+            if response.status != 200:
+                # Only server errors count against the host
+                if response.status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                self.failures += 1
+                daily_logger.log_data_fetch(url, False, f"HTTP {response.status}")
+                return fallback
+
+            breaker.record_success()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if loader is not None:
+                content_hash = digest.hexdigest()
+            else:
+                content_hash = hashlib.blake2b(
+                    response.body, digest_size=16
+                ).hexdigest()
+
+            # Same bytes as before, keep the current version and its derived data.
+            # A streamed body has already been parsed by now, so an unchanged one
+            # costs a full parse unless the CDN answers the conditional request with 304
+            if entry and entry.content_hash == content_hash:
+                entry.etag = etag
+                entry.last_modified = last_modified
+                entry.touch(ttl)
+                logger.debug(f"Dataset content unchanged: {url}")
+                return entry.data
+
+            # Large bodies are parsed in a worker process, small ones on a thread
+            try:
+                if loader is not None:
+                    if parse_errors:
+                        raise parse_errors[0]
+                    data = await self._run("finish", parser.close)
+                    snapshot = data.to_snapshot()
+                else:
+                    data = snapshot = await self._run(
+                        "parse", json.loads, response.body, size=response.size
+                    )
+            except ValueError as e:
+                self.failures += 1
+                logger.error(f"Malformed data from {url}: {e}")
+                daily_logger.log_data_fetch(url, False, f"Malformed data: {e}")
+                return fallback
+            self.entries[url] = CacheEntry(
+                data, response.size, ttl, etag, last_modified, content_hash
+            )
+            self._on_dataset_changed(url, data)
+
+            # Persist the new payload without blocking the event loop
+            self._spawn(
+                asyncio.to_thread(
+                    self.snapshots.save,
+                    url,
+                    snapshot,
+                    response.size,
+                    etag,
+                    last_modified,
+                    content_hash,
+                )
+            )
+
+            elapsed = (time.perf_counter() - start) * 1000
+            daily_logger.log_data_fetch(
+                url, True, f"{response.size} bytes in {elapsed:.0f}ms"
+            )
+            return data
+
+        except Exception as e:
+            breaker.record_failure()
+            self.failures += 1
+            logger.error(f"Error fetching data from {url}: {e}")
+            return fallback
+        finally:
+            self.inflight.pop(url, None)
+
+    # Fetch every known dataset concurrently and log a startup report
+    async def prewarm(self) -> list:
+        async def warm(name: str, url: str) -> dict:
+            start = time.perf_counter()
+            from_snapshot = url in self.entries
+            data = await self.get(url)
+            entry = self.entries.get(url)
+            return {
+                "name": name,
+                "source": "snapshot" if from_snapshot else "network",
+                "success": data is not None,
+                "elapsed_ms": (time.perf_counter() - start) * 1000,
+                "size": entry.size if entry else 0,
+            }
+
+        start = time.perf_counter()
+        report = await asyncio.gather(
+            *(warm(name, url) for name, url in DATASETS.items())
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+
+        loaded = sum(1 for result in report if result["success"])
+        total_size = sum(result["size"] for result in report)
+        logger.info(
+            f"Dataset prewarm complete: {loaded}/{len(report)} datasets, "
+            f"{total_size / 1024:.1f} KB in {elapsed:.0f}ms"
+        )
+        for result in report:
+            if result["success"]:
+                logger.info(
+                    f"Prewarmed {result['name']} from {result['source']}: "
+                    f"{result['size'] / 1024:.1f} KB in {result['elapsed_ms']:.0f}ms"
+                )
+            else:
+                logger.warning(
+                    f"Failed to prewarm {result['name']} "
+                    f"after {result['elapsed_ms']:.0f}ms"
+                )
+
+        return report
+
+    # Get cache statistics
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "fetches": self.fetches,
+            "not_modified": self.not_modified,
+            "failures": self.failures,
+            "short_circuited": self.short_circuited,
+            "hit_rate": ((self.hits + self.stale_hits) / lookups * 100)
+            if lookups
+            else 0.0,
+            "cached_bytes": sum(entry.size for entry in self.entries.values()),
+        }
+
+    # Get the state of every host circuit breaker
+    def get_breaker_states(self) -> list:
+        return [breaker.get_state() for breaker in self.breakers.values()]
+
+    async def close(self):
+        # Cancel background refreshes still in flight
+        for task in list(self.inflight.values()):
+            task.cancel()
+
+        # Let pending snapshot writes finish
+        if self.background_tasks:
+            await asyncio.gather(*self.background_tasks, return_exceptions=True)
@@ -0,0 +1,66 @@
+import copy
+import discord
+from collections import OrderedDict
+from modules.embeds import add_embed_footer
+
+# Rendered embeds kept across commands and argument combinations
+EMBED_CACHE_SIZE = 256
+
+
+# Rendered embeds for commands whose output only depends on their arguments and data
+class EmbedCache:
+    def __init__(self, datastore, max_size: int = EMBED_CACHE_SIZE):
+        self.datastore = datastore
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # Version of the data an embed was built from, None for static embeds
+    def _get_version(self, url: str):
+        return self.datastore.get_version(url) if url else None
+
+    # Get a ready-to-send copy of a cached embed, or None when missing or outdated
+    def get(self, command: str, args: tuple = (), url: str = None) -> discord.Embed:
+        # Keep the dataset revalidating like any other read
+        if url and self.datastore.peek(url) is None:
+            self.misses += 1
+            return None
+
+        key = (command, args, url)
+        cached = self.entries.get(key)
+        if cached is None or cached[0] != self._get_version(url):
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+
+        # A fresh copy with a new footer timestamp, safe for the caller to edit
+        return add_embed_footer(discord.Embed.from_dict(copy.deepcopy(cached[1])))
+
+    # Store an embed built from the current version of its data
+    def set(
+        self, command: str, embed: discord.Embed, args: tuple = (), url: str = None
+    ):
+        data = copy.deepcopy(embed.to_dict())
+        data.pop("timestamp", None)
+
+        key = (command, args, url)
+        self.entries[key] = (self._get_version(url), data)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    # Get cache statistics
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total * 100 if total else 0.0,
+        }
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from modules.datastore import DATASETS
+from modules.logger import get_logger
+from modules.models import normalize_name
+
+logger = get_logger()
+
+# Sub-resource fetches allowed at once while building the graph
+BUILD_CONCURRENCY = 8
+
+
+# A tank joined with its abilities and compatible agents
+class TankNode:
+    __slots__ = ("tank", "abilities", "agents", "sources")
+
+    def __init__(self, tank, abilities, agents: list, sources: tuple):
+        self.tank = tank
+        self.abilities = abilities
+        self.agents = agents
+        self.sources = sources
+
+
+# An agent joined with every tank that can use it
+class AgentNode:
+    __slots__ = ("name", "tanks")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.tanks = []
+
+
+# Tank <-> agent <-> ability cross-references, rebuilt once per data version
+class CrossReferenceGraph:
+    def __init__(self, datastore, views):
+        self.datastore = datastore
+        self.views = views
+        self.tanks_url = DATASETS["tanks"]
+        self.agents_url = DATASETS["agents"]
+        self.tanks = {}
+        self.agents = {}
+        self.source_urls = set()
+
+        self.build_task = None
+        self.dirty = False
+        self.builds = 0
+        self.built_at = None
+        self.build_ms = 0.0
+
+    # Whether the graph has been built at least once
+    def is_ready(self) -> bool:
+        return self.built_at is not None
+
+    # Rebuild in the background, coalescing changes that arrive mid-build
+    def schedule_rebuild(self):
+        if self.build_task is not None and not self.build_task.done():
+            self.dirty = True
+            return
+        self.build_task = asyncio.create_task(self._rebuild_loop())
+
+    async def _rebuild_loop(self):
+        while True:
+            self.dirty = False
+            try:
+                await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error building cross-reference graph: {e}")
+            if not self.dirty:
+                return
+
+    # Rebuild when tanks, agents or any per-tank payload changes
+    async def on_dataset_changed(self, url: str, data):
+        if url in (self.tanks_url, self.agents_url) or url in self.source_urls:
+            self.schedule_rebuild()
+
+    # Join every tank with its abilities and agents, then swap the graph in
+    async def rebuild(self):
+        start = time.perf_counter()
+        tanks_data, agents_data = await asyncio.gather(
+            self.datastore.get(self.tanks_url),
+            self.datastore.get(self.agents_url),
+        )
+        if not tanks_data:
+            return
+
+        # Models come from the views, parsed on a worker
+        tanks_view, agents_view = await asyncio.gather(
+            self.views.tanks(), self.views.agents()
+        )
+        if tanks_view is None:
+            return
+        tanks = tanks_view.all
+        agents = agents_view.all if agents_data and agents_view else ()
+        semaphore = asyncio.Semaphore(BUILD_CONCURRENCY)
+
+        async def fetch(url):
+            if not url:
+                return None
+            async with semaphore:
+                return await self.datastore.get(url)
+
+        async def join(tank):
+            abilities, tank_agents = await asyncio.gather(
+                fetch(tank.abilities_url), fetch(tank.agents_url)
+            )
+            agent_list = tank_agents.get("agents", []) if tank_agents else []
+            sources = tuple(
+                url for url in (tank.abilities_url, tank.agents_url) if url
+            )
+            return TankNode(tank, abilities, agent_list, sources)
+
+        nodes = await asyncio.gather(*(join(tank) for tank in tanks))
+
+        tank_nodes = {}
+        agent_nodes = {}
+        source_urls = set()
+
+        # Agents listed in agents.json, with their declared compatible tanks
+        for agent in agents:
+            agent_node = AgentNode(agent.name)
+            for tank_name in agent.compatible_tanks:
+                if tank_name not in agent_node.tanks:
+                    agent_node.tanks.append(tank_name)
+            agent_nodes[agent.key] = agent_node
+
+        # Tanks, and the reverse edges from each tank's agent list.
+        # Only tanks /tank can open are listed under an agent
+        for node in nodes:
+            tank_name = node.tank.name
+            tank_nodes[node.tank.key] = node
+            source_urls.update(node.sources)
+            if not node.tank.available:
+                continue
+            for agent in node.agents:
+                key = normalize_name(agent.get("name", ""))
+                if not key:
+                    continue
+                if key not in agent_nodes:
+                    agent_nodes[key] = AgentNode(agent["name"])
+                if tank_name not in agent_nodes[key].tanks:
+                    agent_nodes[key].tanks.append(tank_name)
+
+        self.tanks = tank_nodes
+        self.agents = agent_nodes
+        self.source_urls = source_urls
+        self.builds += 1
+        self.built_at = time.time()
+        self.build_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(
+            f"Cross-reference graph built with {len(tank_nodes)} tanks and "
+            f"{len(agent_nodes)} agents in {self.build_ms:.0f}ms"
+        )
+
+    # Look up a tank node, keeping its payloads revalidating in the background
+    def get_tank(self, name: str) -> TankNode:
+        node = self.tanks.get(normalize_name(name))
+        if node is not None:
+            for url in node.sources:
+                self.datastore.peek(url)
+        return node
+
+    def get_agent(self, name: str) -> AgentNode:
+        return self.agents.get(normalize_name(name))
+
+    # Get graph status for diagnostics
+    def get_stats(self) -> dict:
+        return {
+            "tanks": len(self.tanks),
+            "agents": len(self.agents),
+            "builds": self.builds,
+            "built_at": self.built_at,
+            "build_ms": self.build_ms,
+        }
+
+    async def close(self):
+        if self.build_task is not None:
+            self.build_task.cancel()
+            await asyncio.gather(self.build_task, return_exceptions=True)
@@ -0,0 +1,151 @@
+import aiohttp
+import os
+import time
+from urllib.parse import urlparse
+from modules.logger import get_logger
+
+logger = get_logger()
+
+# Bytes handed to a streaming consumer at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# A fully read HTTP response, streamed responses have no body
+class HTTPResponse:
+    __slots__ = ("status", "headers", "body", "size")
+
+    def __init__(self, status: int, headers, body: bytes, size: int = None):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.size = len(body) if size is None else size
+
+
+# Request metrics for a single host
+class HostMetrics:
+    __slots__ = ("requests", "errors", "bytes_received", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, size: int):
+        self.requests += 1
+        self.bytes_received += size
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "avg_ms": self.total_ms / self.requests if self.requests else 0.0,
+            "max_ms": self.max_ms,
+        }
+
+
+# Bot-wide pooled HTTP client shared by every cog and monitor
+class HTTPClient:
+    def __init__(self):
+        self.session = None
+        self.connect_timeout = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+        self.read_timeout = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+        self.total_timeout = float(os.getenv("HTTP_TOTAL_TIMEOUT", "30"))
+        self.limit = 100
+        self.limit_per_host = 10
+        self.metrics = {}
+
+        logger.info(
+            f"HTTP client initialized with {self.connect_timeout}s connect / "
+            f"{self.read_timeout}s read / {self.total_timeout}s total timeouts"
+        )
+
+    # Create the pooled session, must run inside the event loop
+    async def initialize(self):
+        if self.session is not None and not self.session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    def _get_metrics(self, url: str) -> HostMetrics:
+        host = urlparse(url).netloc
+        if host not in self.metrics:
+            self.metrics[host] = HostMetrics()
+        return self.metrics[host]
+
+    # Send a request and read the whole body, recording latency and size
+    async def request(self, method: str, url: str, **kwargs) -> HTTPResponse:
+        await self.initialize()
+        metrics = self._get_metrics(url)
+        start = time.perf_counter()
+
+        try:
+            async with self.session.request(method, url, **kwargs) as response:
+                body = await response.read()
+                result = HTTPResponse(response.status, response.headers, body)
+        except Exception:
+            metrics.errors += 1
+            raise
+
+        metrics.record((time.perf_counter() - start) * 1000, len(body))
+        return result
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HTTPResponse:
+        return await self.request("POST", url, **kwargs)
+
+    # GET a URL and await consume() on a 200 body chunk by chunk instead of buffering it.
+    # consume() may outlast the total timeout, so only connect and reads are timed
+    async def stream(
+        self, url: str, consume, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs
+    ) -> HTTPResponse:
+        await self.initialize()
+        metrics = self._get_metrics(url)
+        start = time.perf_counter()
+
+        try:
+            timeout = aiohttp.ClientTimeout(
+                total=None, connect=self.connect_timeout, sock_read=self.read_timeout
+            )
+            async with self.session.get(url, timeout=timeout, **kwargs) as response:
+                if response.status == 200:
+                    size = 0
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        size += len(chunk)
+                        await consume(chunk)
+                    result = HTTPResponse(response.status, response.headers, None, size)
+                else:
+                    body = await response.read()
+                    result = HTTPResponse(response.status, response.headers, body)
+        except Exception:
+            metrics.errors += 1
+            raise
+
+        metrics.record((time.perf_counter() - start) * 1000, result.size)
+        return result
+
+    # Get per-host request metrics
+    def get_stats(self) -> dict:
+        return {host: metrics.to_dict() for host, metrics in self.metrics.items()}
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
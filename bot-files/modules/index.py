@@ -0,0 +1,252 @@
+import bisect
+import re
+import time
+from modules.autocomplete import MAX_CHOICES
+
+# Splits a name into words for word-boundary matching
+WORD_BOUNDARY = re.compile(r"[\s\-_./()']+")
+
+# Numbers in a name, which tell variants like "Leopard 1" and "Leopard 2" apart
+NUMBERS = re.compile(r"\d+")
+
+# Minimum trigram similarity for a name to be suggested
+MIN_SIMILARITY = 0.4
+
+# Similarity needed to resolve a typo without asking, and the lead it needs over the runner-up
+AUTO_RESOLVE_SIMILARITY = 0.6
+AUTO_RESOLVE_MARGIN = 0.15
+
+
+# Padded character trigrams of a case-folded name
+def trigrams(text: str) -> set:
+    text = f"  {WORD_BOUNDARY.sub(' ', text).strip()} "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+# Where a search left off, so a longer query only looks at earlier matches
+class SearchState:
+    __slots__ = ("query", "low", "high", "substrings")
+
+    def __init__(self, query: str, low: int, high: int, substrings: list):
+        self.query = query
+        self.low = low
+        self.high = high
+        self.substrings = substrings
+
+
+# Case-folded prefix index over a list of display names
+class NameIndex:
+    __slots__ = ("names", "folded", "keys", "targets", "exact", "grams", "postings")
+
+    def __init__(self, names: list):
+        self.names = list(dict.fromkeys(names))
+        self.folded = [name.casefold() for name in self.names]
+
+        # Every name is indexed under itself and under each later word
+        entries = []
+        for position, folded in enumerate(self.folded):
+            entries.append((folded, position))
+            for match in WORD_BOUNDARY.finditer(folded):
+                suffix = folded[match.end():]
+                if suffix:
+                    entries.append((suffix, position))
+        entries.sort()
+
+        self.keys = [key for key, _ in entries]
+        self.targets = [position for _, position in entries]
+
+        # Exact lookups and trigram postings for typo tolerance
+        self.exact = {}
+        for position, folded in enumerate(self.folded):
+            self.exact.setdefault(folded, position)
+        self.grams = [trigrams(folded) for folded in self.folded]
+        self.postings = {}
+        for position, grams in enumerate(self.grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # Names matching the typed text: full prefix, then word prefix, then substring
+    def search(
+        self, current: str, limit: int = MAX_CHOICES, deadline: float = None
+    ) -> list:
+        return self.narrow(None, current, limit, deadline)[0]
+
+    # Search starting from an earlier query's state, returning (names, state)
+    def narrow(
+        self,
+        previous,
+        current: str,
+        limit: int = MAX_CHOICES,
+        deadline: float = None,
+    ) -> tuple:
+        current = current.casefold().strip()
+        if not current:
+            return self.names[:limit], None
+
+        # A longer query can only match within the previous query's matches
+        low, high, within = 0, len(self.keys), None
+        if previous is not None and current.startswith(previous.query):
+            low, high, within = previous.low, previous.high, previous.substrings
+
+        prefix_matches = []
+        word_matches = []
+        seen = set()
+
+        # Walk the sorted keys that start with the typed text
+        start = bisect.bisect_left(self.keys, current, low, high)
+        end = bisect.bisect_left(self.keys, current + "\U0010ffff", start, high)
+        for i in range(start, end):
+            position = self.targets[i]
+            if position in seen:
+                continue
+            seen.add(position)
+            if self.folded[position] == self.keys[i]:
+                prefix_matches.append(position)
+            else:
+                word_matches.append(position)
+            if len(prefix_matches) >= limit:
+                break
+
+        results = (prefix_matches + word_matches)[:limit]
+
+        # Fill the rest with substring matches, keeping all of them for the next keystroke
+        substrings = None
+        if len(results) < limit:
+            substrings = []
+            candidates = within if within is not None else range(len(self.folded))
+            for count, position in enumerate(candidates):
+                if current in self.folded[position]:
+                    substrings.append(position)
+                if deadline and count % 256 == 255 and time.perf_counter() > deadline:
+                    substrings = None
+                    break
+
+            for position in substrings or ():
+                if position not in seen:
+                    results.append(position)
+                    if len(results) >= limit:
+                        break
+
+        state = SearchState(current, start, end, substrings)
+        return [self.names[position] for position in results], state
+
+    # Closest names by trigram similarity, best first
+    def suggest(self, query: str, limit: int = 3) -> list:
+        query_grams = trigrams(query.casefold())
+        if not query_grams:
+            return []
+
+        # Count shared trigrams using only the names that have any
+        shared = {}
+        for gram in query_grams:
+            for position in self.postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        scored = []
+        for position, count in shared.items():
+            similarity = 2 * count / (len(query_grams) + len(self.grams[position]))
+            if similarity >= MIN_SIMILARITY:
+                scored.append((similarity, position))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        return [
+            (self.names[position], similarity) for similarity, position in scored[:limit]
+        ]
+
+    # Resolve a typed name to a known one, returning (name or None, suggestions)
+    def resolve(self, query: str) -> tuple:
+        position = self.exact.get(query.casefold().strip())
+        if position is not None:
+            return self.names[position], []
+
+        suggestions = self.suggest(query)
+        if suggestions:
+            best_name, best = suggestions[0]
+            runner_up = suggestions[1][1] if len(suggestions) > 1 else 0.0
+            if (
+                best >= AUTO_RESOLVE_SIMILARITY
+                and best - runner_up >= AUTO_RESOLVE_MARGIN
+                and NUMBERS.findall(query) == NUMBERS.findall(best_name)
+            ):
+                return best_name, []
+
+        return None, [name for name, _ in suggestions]
+
+
+# Splits free text into searchable terms
+TERM = re.compile(r"\w+")
+
+
+# Inverted index over documents from several datasets
+class SearchIndex:
+    __slots__ = ("documents", "postings", "terms")
+
+    # documents: (kind, name, detail, [(text, weight), ...]) tuples
+    def __init__(self, documents: list):
+        self.documents = []
+        self.postings = {}
+
+        for doc_id, (kind, name, detail, fields) in enumerate(documents):
+            self.documents.append((kind, name, detail))
+            for text, weight in fields:
+                if not text:
+                    continue
+                for term in TERM.findall(str(text).casefold()):
+                    postings = self.postings.setdefault(term, {})
+                    # A term counts once per document, at its best field weight
+                    if postings.get(doc_id, 0) < weight:
+                        postings[doc_id] = weight
+
+        self.terms = sorted(self.postings)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    # Documents containing a term, or any term it is a prefix of
+    def _match_term(self, term: str) -> dict:
+        matches = dict(self.postings.get(term, {}))
+        start = bisect.bisect_left(self.terms, term)
+        end = bisect.bisect_left(self.terms, term + "\U0010ffff", start)
+        for i in range(start, end):
+            if self.terms[i] == term:
+                continue
+            for doc_id, weight in self.postings[self.terms[i]].items():
+                # Partial words score a little below whole ones
+                if matches.get(doc_id, 0) < weight - 0.5:
+                    matches[doc_id] = weight - 0.5
+        return matches
+
+    # Documents matching every query term, best first
+    def search(self, query: str, limit: int = 10) -> list:
+        terms = TERM.findall(query.casefold())
+        if not terms:
+            return []
+
+        scores = None
+        for term in dict.fromkeys(terms):
+            matches = self._match_term(term)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {
+                    doc_id: score + matches[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in matches
+                }
+            if not scores:
+                return []
+
+        # Exact name matches always come first
+        folded = query.casefold().strip()
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (
+                self.documents[item[0]][1].casefold() != folded,
+                -item[1],
+                self.documents[item[0]][1],
+            ),
+        )
+        return [self.documents[doc_id] for doc_id, _ in ranked[:limit]]
@@ -0,0 +1,197 @@
+import heapq
+from array import array
+from modules.record_store import NULL_INT, RECORD_MODES, is_null
+
+try:
+    import numpy as np
+except ImportError:  # Fall back to the pure Python aggregation
+    np = None
+
+# Leaderboard that combines every mode
+GLOBAL_MODE = "global"
+
+# Entries kept per leaderboard
+LEADERBOARD_SIZE = 10
+
+
+# Whole numbers from a float column display like the original integers
+def _display_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+# Top per-player best rows of the record store for one mode and category
+class Leaderboard:
+    __slots__ = ("store", "column", "rows")
+
+    def __init__(self, store, column: array, rows: list):
+        self.store = store
+        self.column = column
+        self.rows = array("I", rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    # (player, value, vehicle, agent, mode) rows for the top entries
+    def top(self, limit: int = LEADERBOARD_SIZE) -> list:
+        store = self.store
+        return [
+            (
+                store.players[store.player_codes[row]],
+                _display_value(self.column[row]),
+                store.vehicles[store.vehicle_codes[row]] or "N/A",
+                store.agents[store.agent_codes[row]] or "N/A",
+                store.get_mode(row),
+            )
+            for row in self.rows[:limit]
+        ]
+
+
+# Every mode x category leaderboard for one version of player-records.json
+class Leaderboards:
+    __slots__ = ("boards", "store")
+
+    def __init__(self, boards: dict, store):
+        self.boards = boards
+        self.store = store
+
+    # Get the leaderboard for a mode and category, or None when it has no entries
+    def get(self, mode: str, category: str) -> Leaderboard:
+        return self.boards.get((mode, category))
+
+    # Number of records behind a mode's leaderboards
+    def count(self, mode: str) -> int:
+        if mode == GLOBAL_MODE:
+            return sum(self.store.count(m) for m in RECORD_MODES)
+        return self.store.count(mode)
+
+
+# Best row per player within a range of rows, in first-seen player order
+def _best_rows(column: array, player_codes: array, skip: set, start: int, end: int):
+    best = {}
+    for row in range(start, end):
+        value = column[row]
+        if is_null(value):
+            continue
+        player = player_codes[row]
+        if player in skip:
+            continue
+        current = best.get(player)
+        if current is None or value > column[current]:
+            best[player] = row
+    return best
+
+
+# Highest-valued rows of a best-per-player dict, first-seen players ahead on ties
+def _top_rows(column: array, best: dict, limit: int) -> list:
+    return heapq.nsmallest(limit, best.values(), key=lambda row: -column[row])
+
+
+# Pure Python group-by-max, folding each mode into the global board
+def _build_python(store, column: array, skip: set, limit: int, boards: dict, category):
+    global_best = {}
+    for mode in store.modes:
+        start, end = store.mode_ranges[mode]
+        best = _best_rows(column, store.player_codes, skip, start, end)
+        if best:
+            boards[(mode, category)] = _top_rows(column, best, limit)
+        if mode not in RECORD_MODES:
+            continue
+
+        # Earlier modes win ties, as if every mode was scanned in order
+        for player, row in best.items():
+            current = global_best.get(player)
+            if current is None or column[row] > column[current]:
+                global_best[player] = row
+
+    if global_best:
+        boards[(GLOBAL_MODE, category)] = _top_rows(column, global_best, limit)
+
+
+# Vectorized group-by-max and top-k selection over a range of valid rows
+def _top_rows_numpy(values, players, valid, start: int, end: int, limit: int) -> list:
+    rows = np.flatnonzero(valid[start:end]) + start
+    if not rows.size:
+        return []
+    row_values = values[rows]
+    row_players = players[rows]
+
+    # Best value per player in one scatter pass
+    floor = np.iinfo(values.dtype).min if values.dtype.kind == "i" else -np.inf
+    best = np.full(row_players.max() + 1, floor, dtype=values.dtype)
+    np.maximum.at(best, row_players, row_values)
+    seen = np.zeros(best.size, dtype=bool)
+    seen[row_players] = True
+    candidates = np.flatnonzero(seen)
+
+    # Keep only the players that can reach the top, ties at the cut included
+    if candidates.size > limit:
+        candidate_values = best[candidates]
+        cut = np.partition(candidate_values, candidates.size - limit)[
+            candidates.size - limit
+        ]
+        candidates = candidates[candidate_values >= cut]
+
+    # Each candidate's first row and earliest best row break ties like a scan would
+    seen[:] = False
+    seen[candidates] = True
+    mask = seen[row_players]
+    rows, row_players, row_values = rows[mask], row_players[mask], row_values[mask]
+    _, first = np.unique(row_players, return_index=True)
+    is_best = row_values == best[row_players]
+    _, best_first = np.unique(row_players[is_best], return_index=True)
+    best_rows = rows[is_best][best_first]
+
+    ranking = np.lexsort((rows[first], -best[candidates]))[:limit]
+    return best_rows[ranking].tolist()
+
+
+# NumPy group-by-max over each mode and the combined global range
+def _build_numpy(store, column: array, skip: set, limit: int, boards: dict, category):
+    values = np.frombuffer(column, dtype=column.typecode)
+    players = np.frombuffer(store.player_codes, dtype=store.player_codes.typecode)
+    if column.typecode == "q":
+        valid = values != NULL_INT
+    else:
+        valid = ~np.isnan(values)
+    if skip:
+        valid &= ~np.isin(players, list(skip))
+
+    # Known modes are stored first, so the global board is one contiguous range
+    global_end = 0
+    for mode in store.modes:
+        start, end = store.mode_ranges[mode]
+        rows = _top_rows_numpy(values, players, valid, start, end, limit)
+        if rows:
+            boards[(mode, category)] = rows
+        if mode in RECORD_MODES:
+            global_end = end
+
+    rows = _top_rows_numpy(values, players, valid, 0, global_end, limit)
+    if rows:
+        boards[(GLOBAL_MODE, category)] = rows
+
+
+# Build all leaderboards from the columnar record store
+def build_leaderboards(
+    store, categories: list, limit: int = LEADERBOARD_SIZE, use_numpy: bool = True
+) -> Leaderboards:
+    build = _build_numpy if np is not None and use_numpy else _build_python
+
+    # Records without a player id never make a leaderboard
+    skip = {code for code, player_id in enumerate(store.players) if not player_id}
+    boards = {}
+
+    for category in categories:
+        column = store.get_stat(category)
+        if column is None:
+            # A stat no record has counts as 0 for everyone
+            column = array("q", [0]) * len(store)
+
+        rows_by_board = {}
+        build(store, column, skip, limit, rows_by_board, category)
+        for key, rows in rows_by_board.items():
+            boards[key] = Leaderboard(store, column, rows)
+
+    return Leaderboards(boards, store)
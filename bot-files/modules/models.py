@@ -0,0 +1,162 @@
+import sys
+
+# Availability markers used across the datasets
+AVAILABLE = "Available Now"
+DISPLAYED = "displayed"
+
+
+# Intern short strings that repeat across many entities
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Case-folded lookup key for a name
+def normalize_name(name: str) -> str:
+    return name.casefold().strip()
+
+
+class Tank:
+    __slots__ = (
+        "name",
+        "key",
+        "slug",
+        "nation",
+        "type",
+        "tank_class",
+        "state",
+        "image",
+        "description",
+        "abilities_url",
+        "agents_url",
+        "available",
+        "displayed",
+    )
+
+    def __init__(self, data: dict):
+        self.name = data.get("name", "Unknown")
+        self.key = normalize_name(self.name)
+        self.slug = data.get("slug")
+        self.nation = _intern(data.get("nation"))
+        self.type = _intern(data.get("type"))
+        self.tank_class = _intern(data.get("class"))
+        self.state = _intern(data.get("state"))
+        self.image = data.get("image")
+        self.description = data.get("description")
+        self.abilities_url = data.get("abilities")
+        self.agents_url = data.get("agents")
+        self.available = self.tank_class == AVAILABLE
+        self.displayed = self.state == DISPLAYED
+
+
+class Map:
+    __slots__ = (
+        "name",
+        "key",
+        "slug",
+        "description",
+        "image",
+        "status",
+        "state",
+        "available",
+        "displayed",
+    )
+
+    def __init__(self, data: dict):
+        self.name = data.get("name", "Unknown")
+        self.key = normalize_name(self.name)
+        self.slug = data.get("slug")
+        self.description = data.get("description")
+        self.image = data.get("image")
+        self.status = _intern(data.get("status"))
+        self.state = _intern(data.get("state"))
+        self.available = self.status == AVAILABLE
+        self.displayed = self.state == DISPLAYED
+
+
+class Agent:
+    __slots__ = (
+        "name",
+        "key",
+        "slug",
+        "specialty",
+        "description",
+        "story",
+        "image",
+        "status",
+        "state",
+        "compatible_tanks",
+        "available",
+        "displayed",
+    )
+
+    def __init__(self, data: dict):
+        self.name = data.get("name", "Unknown")
+        self.key = normalize_name(self.name)
+        self.slug = data.get("slug")
+        self.specialty = _intern(data.get("specialty"))
+        self.description = data.get("description")
+        self.story = data.get("story")
+        self.image = data.get("image")
+        self.status = _intern(data.get("status"))
+        self.state = _intern(data.get("state"))
+        self.compatible_tanks = tuple(
+            _intern(tank["name"])
+            for tank in data.get("compatibleTanks", [])
+            if tank.get("name")
+        )
+        self.available = self.status == AVAILABLE
+        self.displayed = self.state == DISPLAYED
+
+
+class Tournament:
+    __slots__ = (
+        "name",
+        "key",
+        "description",
+        "date",
+        "start",
+        "end",
+        "mode",
+        "type",
+        "image",
+        "data_url",
+        "published",
+    )
+
+    def __init__(self, data: dict):
+        self.name = data.get("name", "Unknown")
+        self.key = normalize_name(self.name)
+        self.description = data.get("description")
+        self.date = data.get("date")
+        self.start = data.get("start")
+        self.end = data.get("end")
+        self.mode = _intern(data.get("mode"))
+        self.type = _intern(data.get("type"))
+        self.image = data.get("image")
+        self.data_url = data.get("tournament-data")
+        self.published = bool(data.get("publish"))
+
+
+# Parse tanks.json, which is either a list or {"tanks": [...]}
+def parse_tanks(data) -> tuple:
+    tanks = data if isinstance(data, list) else data.get("tanks", [])
+    return tuple(Tank(tank) for tank in tanks)
+
+
+def parse_maps(data) -> tuple:
+    return tuple(Map(map_data) for map_data in data.get("maps", []))
+
+
+def parse_agents(data) -> tuple:
+    return tuple(Agent(agent) for agent in data.get("agents", []))
+
+
+def parse_tournaments(data) -> tuple:
+    tournaments = data if isinstance(data, list) else data.get("tournaments", [])
+    return tuple(Tournament(tournament) for tournament in tournaments)
+
+
+# Find a model by name, case-insensitively
+def find_by_name(models, name: str):
+    key = normalize_name(name)
+    return next((model for model in models if model.key == key), None)
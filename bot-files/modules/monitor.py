@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 import os
-import aiohttp
 import json
 import traceback
 import asyncio
@@ -17,7 +16,7 @@ class BotMonitor:
     def __init__(self, bot):
         self.bot = bot
         self.webhook_url = os.getenv("WEBHOOK")
-        self.session = aiohttp.ClientSession()
+        self.http_client = bot.http_client
         self.command_usage = {}
         self.module_usage = {}
         self.error_stats = {}
@@ -63,11 +62,11 @@ class BotMonitor:
                 "avatar_url": "https://raw.githubusercontent.com/HEATLabs/HEAT-Labs-Discord-Bot/refs/heads/main/bot-files/assets/public-assets/profile/logo.png",
             }
 
-            async with self.session.post(self.webhook_url, json=data) as response:
-                if response.status in (200, 204):
-                    logger.debug(f"Monitor webhook sent: {title}")
-                else:
-                    logger.warning(f"Failed to send webhook: HTTP {response.status}")
+            response = await self.http_client.post(self.webhook_url, json=data)
+            if response.status in (200, 204):
+                logger.debug(f"Monitor webhook sent: {title}")
+            else:
+                logger.warning(f"Failed to send webhook: HTTP {response.status}")
 
         except Exception as e:
             logger.error(f"Error sending webhook: {e}")
@@ -417,13 +416,6 @@ class BotMonitor:
     async def on_server_tracker_error(self, error: Exception):
         await self.on_module_error("ServerTracker", error, "Server Tracking")
 
-    # Close the session when cog unloads
-    def cog_unload(self):
-        import asyncio
-
-        asyncio.create_task(self.session.close())
-        logger.info("Monitor unloaded")
-
 
 async def setup(bot: commands.Bot) -> None:
     # Check if monitor is already loaded
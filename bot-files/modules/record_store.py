@@ -0,0 +1,381 @@
+import codecs
+import json
+import math
+import re
+import sys
+from array import array
+
+# Game modes in player-records.json, in the order rows are stored and combined
+RECORD_MODES = ["conquest", "control", "hardpoint", "kill-confirmed"]
+
+# Fields shown as text rather than aggregated
+TEXT_FIELDS = ("vehicle", "agent")
+
+# Marks an explicit null in an integer stat column
+NULL_INT = -(2**63)
+
+# Unparsed text the stream parser may hold while waiting for the rest of a value
+MAX_PENDING_CHARS = 4 * 1024 * 1024
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+# Whether a stored stat value is an explicit null
+def is_null(value) -> bool:
+    return value == NULL_INT or value != value
+
+
+# Maps strings to small integer codes, keeping one copy of each
+class StringTable:
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def encode(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(sys.intern(value) if isinstance(value, str) else value)
+        return code
+
+
+# Copy an integer column to floats, keeping nulls
+def _to_float(column: array) -> array:
+    return array("d", (math.nan if v == NULL_INT else v for v in column))
+
+
+# Rows of one mode, collected before the modes are put in order
+class _ModeSegment:
+    __slots__ = ("rows", "player_codes", "vehicle_codes", "agent_codes", "stats")
+
+    def __init__(self):
+        self.rows = 0
+        self.player_codes = array("I")
+        self.vehicle_codes = array("I")
+        self.agent_codes = array("I")
+        self.stats = {}
+
+
+# Appends records straight into typed columns, one mode segment at a time
+class RecordStoreBuilder:
+    def __init__(self):
+        self.players = StringTable()
+        self.vehicles = StringTable()
+        self.agents = StringTable()
+        self.segments = {}
+
+    def add(self, mode: str, player_id: str, record: dict):
+        # A wrongly shaped record is a malformed document, like a JSON syntax error
+        if not isinstance(record, dict):
+            raise ValueError(f"Player record for {player_id} is not an object")
+        vehicle = record.get("vehicle")
+        agent = record.get("agent")
+        for field, value in (("vehicle", vehicle), ("agent", agent)):
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"Player record {field} for {player_id} is not text")
+
+        segment = self.segments.get(mode)
+        if segment is None:
+            segment = self.segments[mode] = _ModeSegment()
+
+        segment.player_codes.append(self.players.encode(player_id))
+        segment.vehicle_codes.append(self.vehicles.encode(vehicle))
+        segment.agent_codes.append(self.agents.encode(agent))
+
+        for key, value in record.items():
+            if key in TEXT_FIELDS:
+                continue
+            if not isinstance(value, (int, float)):
+                # Non-numeric values can't be ranked, keep them as nulls
+                value = None
+
+            column = segment.stats.get(key)
+            if column is None:
+                # Earlier rows without this stat count as 0
+                column = segment.stats[key] = array("q", bytes(8 * segment.rows))
+            if column.typecode == "q" and isinstance(value, float):
+                column = segment.stats[key] = _to_float(column)
+
+            if value is None:
+                value = NULL_INT if column.typecode == "q" else math.nan
+            try:
+                column.append(value)
+            except OverflowError:
+                column = segment.stats[key] = _to_float(column)
+                column.append(value)
+
+        segment.rows += 1
+        # Records without a stat count as 0, like record.get(stat, 0)
+        for column in segment.stats.values():
+            if len(column) < segment.rows:
+                column.append(0)
+
+    # Put the segments in mode order and join them into one store
+    def finish(self) -> "RecordStore":
+        store = RecordStore()
+        modes = RECORD_MODES + [m for m in self.segments if m not in RECORD_MODES]
+        segments = [(m, self.segments[m]) for m in modes if m in self.segments]
+
+        keys = {}
+        for _, segment in segments:
+            for key, column in segment.stats.items():
+                keys[key] = "d" if column.typecode == "d" else keys.get(key, "q")
+
+        store.stats = {key: array(typecode) for key, typecode in keys.items()}
+        rows = 0
+        for mode, segment in segments:
+            store.player_codes.extend(segment.player_codes)
+            store.vehicle_codes.extend(segment.vehicle_codes)
+            store.agent_codes.extend(segment.agent_codes)
+            for key, column in store.stats.items():
+                values = segment.stats.get(key)
+                if values is None:
+                    values = array(column.typecode, [0]) * segment.rows
+                elif values.typecode != column.typecode:
+                    values = _to_float(values)
+                column.extend(values)
+            store.mode_ranges[mode] = (rows, rows + segment.rows)
+            rows += segment.rows
+
+        store.players = tuple(self.players.values)
+        store.vehicles = tuple(self.vehicles.values)
+        store.agents = tuple(self.agents.values)
+        store.modes = tuple(store.mode_ranges)
+        self.segments = {}
+        return store
+
+
+# Feeds player-records.json into a builder chunk by chunk, one record at a time
+class RecordStreamParser:
+    def __init__(self):
+        self.builder = RecordStoreBuilder()
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.state = "start"
+        self.mode = None
+        self.player_id = None
+        self.closed = False
+
+    def feed(self, chunk: bytes):
+        self.buffer = self.buffer[self.pos :] + self.text_decoder.decode(chunk)
+        self.pos = 0
+        while self._step():
+            pass
+
+        if len(self.buffer) - self.pos > MAX_PENDING_CHARS:
+            raise ValueError("Player records value too large or malformed")
+
+    # Finish parsing once the whole body has been fed
+    def close(self) -> "RecordStore":
+        self.buffer = self.buffer[self.pos :] + self.text_decoder.decode(b"", True)
+        self.pos = 0
+        self.closed = True
+        while self._step():
+            pass
+
+        if self.state != "end":
+            raise ValueError("Player records document ended unexpectedly")
+        return self.builder.finish()
+
+    # Next non-whitespace character, or None when more input is needed
+    def _peek(self):
+        self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else None
+
+    # Decode the JSON value at the cursor, or return False when it is incomplete
+    def _decode(self):
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            if self.closed:
+                raise
+            return False, None
+
+        # A number running to the end of the buffer may continue in the next chunk
+        if end == len(self.buffer) and not self.closed:
+            return False, None
+        self.pos = end
+        return True, value
+
+    # Advance by one token, returning False when more input is needed
+    def _step(self) -> bool:
+        char = self._peek()
+        if char is None:
+            return False
+        state = self.state
+
+        if state == "end":
+            raise ValueError("Unexpected data after the player records document")
+
+        if state in ("start", "records", "players", "record_list"):
+            expected = "[" if state == "record_list" else "{"
+            if char != expected:
+                raise ValueError(f"Expected '{expected}' in player records")
+            self.pos += 1
+            self.state = {
+                "start": "top_key",
+                "records": "mode_key",
+                "players": "player_key",
+                "record_list": "record",
+            }[state]
+            return True
+
+        if char == ",":
+            self.pos += 1
+            return True
+
+        if state in ("top_key", "mode_key", "player_key"):
+            if char == "}":
+                self.pos += 1
+                self.state = {
+                    "top_key": "end",
+                    "mode_key": "top_key",
+                    "player_key": "mode_key",
+                }[state]
+                return True
+            complete, key = self._decode()
+            if not complete:
+                return False
+            if state == "top_key":
+                self.state = "records_colon" if key == "records" else "top_colon"
+            elif state == "mode_key":
+                self.mode = key
+                self.state = "mode_colon"
+            else:
+                self.player_id = key
+                self.state = "player_colon"
+            return True
+
+        if state.endswith("_colon"):
+            if char != ":":
+                raise ValueError("Expected ':' in player records")
+            self.pos += 1
+            self.state = {
+                "top_colon": "top_value",
+                "records_colon": "records",
+                "mode_colon": "players",
+                "player_colon": "record_list",
+            }[state]
+            return True
+
+        # Other top-level values are small and skipped whole
+        if state == "top_value":
+            complete, _ = self._decode()
+            if complete:
+                self.state = "top_key"
+            return complete
+
+        # state == "record"
+        if char == "]":
+            self.pos += 1
+            self.state = "player_key"
+            return True
+        complete, record = self._decode()
+        if not complete:
+            return False
+        self.builder.add(self.mode, self.player_id, record)
+        return True
+
+
+# player-records.json as typed columns with dictionary-encoded strings
+class RecordStore:
+    __slots__ = (
+        "players",
+        "vehicles",
+        "agents",
+        "modes",
+        "player_codes",
+        "vehicle_codes",
+        "agent_codes",
+        "mode_ranges",
+        "stats",
+    )
+
+    def __init__(self):
+        self.players = ()
+        self.vehicles = ()
+        self.agents = ()
+        self.modes = ()
+        self.player_codes = array("I")
+        self.vehicle_codes = array("I")
+        self.agent_codes = array("I")
+        self.mode_ranges = {}
+        self.stats = {}
+
+    # Convert an already parsed JSON document, one row per record grouped by mode
+    @classmethod
+    def from_json(cls, data) -> "RecordStore":
+        builder = RecordStoreBuilder()
+        for mode, players in (data or {}).get("records", {}).items():
+            for player_id, player_records in players.items():
+                for record in player_records:
+                    builder.add(mode, player_id, record)
+        return builder.finish()
+
+    # Parser that builds a store from the raw body without parsing it whole
+    @classmethod
+    def stream_parser(cls) -> RecordStreamParser:
+        return RecordStreamParser()
+
+    # Plain types and bytes that can be written to a snapshot
+    def to_snapshot(self) -> dict:
+        return {
+            "players": self.players,
+            "vehicles": self.vehicles,
+            "agents": self.agents,
+            "mode_ranges": self.mode_ranges,
+            "player_codes": self.player_codes.tobytes(),
+            "vehicle_codes": self.vehicle_codes.tobytes(),
+            "agent_codes": self.agent_codes.tobytes(),
+            "stats": {
+                key: (column.typecode, column.tobytes())
+                for key, column in self.stats.items()
+            },
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict) -> "RecordStore":
+        store = cls()
+        store.players = tuple(data["players"])
+        store.vehicles = tuple(data["vehicles"])
+        store.agents = tuple(data["agents"])
+        store.mode_ranges = dict(data["mode_ranges"])
+        store.modes = tuple(store.mode_ranges)
+        store.player_codes.frombytes(data["player_codes"])
+        store.vehicle_codes.frombytes(data["vehicle_codes"])
+        store.agent_codes.frombytes(data["agent_codes"])
+        for key, (typecode, raw) in data["stats"].items():
+            column = array(typecode)
+            column.frombytes(raw)
+            store.stats[key] = column
+        return store
+
+    def __len__(self) -> int:
+        return len(self.player_codes)
+
+    # Number of records stored for a mode
+    def count(self, mode: str) -> int:
+        start, end = self.mode_ranges.get(mode, (0, 0))
+        return end - start
+
+    # Column of a stat, or None when no record has it
+    def get_stat(self, name: str) -> array:
+        return self.stats.get(name)
+
+    # Mode a row belongs to
+    def get_mode(self, row: int) -> str:
+        for mode, (start, end) in self.mode_ranges.items():
+            if start <= row < end:
+                return mode
+        return None
+
+    # Approximate resident size of the columns, in bytes
+    def get_size(self) -> int:
+        columns = [self.player_codes, self.vehicle_codes, self.agent_codes]
+        columns.extend(self.stats.values())
+        return sum(column.itemsize * len(column) for column in columns)
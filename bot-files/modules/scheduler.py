@@ -0,0 +1,128 @@
+import asyncio
+import random
+import time
+from modules.datastore import DATASETS
+from modules.logger import get_logger
+
+logger = get_logger()
+
+# Base refresh interval for each dataset, in seconds
+REFRESH_INTERVALS = {
+    "player-records": 300,
+    "tanks": 600,
+    "maps": 600,
+    "agents": 600,
+    "memes": 1800,
+    "home-stats": 1800,
+    "changelog": 1800,
+    "game-builds": 3600,
+}
+
+# Datasets nobody has read since the last refresh back off up to this factor
+MAX_IDLE_FACTOR = 4
+
+# Random spread applied to every interval so refreshes don't line up
+JITTER = 0.1
+
+
+# Refreshes datasets on their own interval so commands only read memory
+class RefreshScheduler:
+    def __init__(self, datastore):
+        self.datastore = datastore
+        self.urls = {}
+        self.intervals = {}
+        self.tasks = {}
+        self.status = {}
+        self.running = False
+
+        for name, interval in REFRESH_INTERVALS.items():
+            self.add(name, DATASETS[name], interval)
+
+    # Schedule a URL, e.g. a config file only available remotely
+    def add(self, name: str, url: str, interval: int):
+        self.urls[name] = url
+        self.intervals[name] = interval
+
+        # Scheduled datasets are kept fresh here, the TTL is only a safety net
+        self.datastore.set_ttl(url, interval * (MAX_IDLE_FACTOR + 1))
+        if self.running:
+            self._start_task(name)
+
+    def _start_task(self, name: str):
+        if name in self.tasks:
+            return
+        interval = self.intervals[name]
+        self.status[name] = {
+            "interval": interval,
+            "last_refresh": None,
+            "duration_ms": 0.0,
+            "changed": False,
+            "refreshes": 0,
+            "changes": 0,
+        }
+        self.tasks[name] = asyncio.create_task(self._refresh_loop(name, interval))
+
+    def start(self):
+        self.running = True
+        for name in self.intervals:
+            self._start_task(name)
+
+        logger.info(f"Refresh scheduler started for {len(self.tasks)} datasets")
+
+    async def stop(self):
+        self.running = False
+        for task in self.tasks.values():
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+        self.tasks.clear()
+        logger.info("Refresh scheduler stopped")
+
+    # Refresh a single dataset forever on its interval
+    async def _refresh_loop(self, name: str, interval: int):
+        url = self.urls[name]
+        idle_factor = 1
+        last_reads = self.datastore.get_read_count(url)
+
+        while True:
+            delay = interval * idle_factor
+            delay += random.uniform(-JITTER, JITTER) * delay
+            await asyncio.sleep(delay)
+
+            # Refresh hot datasets on the base interval, back off idle ones
+            reads = self.datastore.get_read_count(url)
+            if reads == last_reads:
+                idle_factor = min(idle_factor * 2, MAX_IDLE_FACTOR)
+            else:
+                idle_factor = 1
+            last_reads = reads
+
+            try:
+                await self.refresh(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error refreshing dataset {name}: {e}")
+
+    # Revalidate a dataset now and record how it went
+    async def refresh(self, name: str) -> bool:
+        start = time.perf_counter()
+        changed = await self.datastore.refresh(self.urls[name])
+        duration = (time.perf_counter() - start) * 1000
+
+        status = self.status[name]
+        status["last_refresh"] = time.time()
+        status["duration_ms"] = duration
+        status["changed"] = changed
+        status["refreshes"] += 1
+        if changed:
+            status["changes"] += 1
+
+        logger.debug(
+            f"Refreshed dataset {name} in {duration:.0f}ms "
+            f"({'changed' if changed else 'unchanged'})"
+        )
+        return changed
+
+    # Get refresh status for every scheduled dataset
+    def get_status(self) -> dict:
+        return {name: status.copy() for name, status in self.status.items()}
@@ -0,0 +1,84 @@
+import hashlib
+import marshal
+import os
+import time
+from modules.logger import get_logger
+
+logger = get_logger()
+
+# Bump when the snapshot layout changes so old files are ignored
+SNAPSHOT_VERSION = 3
+
+
+# Persists the last good copy of each dataset for instant warm starts
+class SnapshotStore:
+    def __init__(self, snapshot_dir: str = "snapshots"):
+        self.snapshot_dir = snapshot_dir
+        self._ensure_snapshot_dir_exists()
+
+    def _ensure_snapshot_dir_exists(self):
+        if not os.path.exists(self.snapshot_dir):
+            os.makedirs(self.snapshot_dir)
+            logger.info(f"Created {self.snapshot_dir} directory")
+
+    # Snapshot filename for a dataset URL
+    def _get_snapshot_path(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.snapshot_dir, f"{digest}.snapshot")
+
+    # Write a dataset snapshot, replacing the previous one atomically
+    def save(
+        self,
+        url: str,
+        data,
+        size: int,
+        etag: str,
+        last_modified: str,
+        content_hash: str,
+    ):
+        path = self._get_snapshot_path(url)
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "saved_at": time.time(),
+            "size": size,
+            "data": data,
+        }
+
+        try:
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as f:
+                marshal.dump(snapshot, f)
+            os.replace(temp_path, path)
+            logger.debug(f"Snapshot saved for {url}")
+        except Exception as e:
+            logger.error(f"Error saving snapshot for {url}: {e}")
+
+    # Load every readable snapshot from disk
+    def load_all(self) -> list:
+        snapshots = []
+        for filename in os.listdir(self.snapshot_dir):
+            if not filename.endswith(".snapshot"):
+                continue
+
+            path = os.path.join(self.snapshot_dir, filename)
+            try:
+                with open(path, "rb") as f:
+                    snapshot = marshal.load(f)
+            except (EOFError, ValueError, TypeError, OSError) as e:
+                logger.warning(f"Skipping unreadable snapshot {filename}: {e}")
+                continue
+
+            if (
+                not isinstance(snapshot, dict)
+                or snapshot.get("version") != SNAPSHOT_VERSION
+            ):
+                logger.warning(f"Skipping outdated snapshot {filename}")
+                continue
+
+            snapshots.append(snapshot)
+
+        return snapshots
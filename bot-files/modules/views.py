@@ -0,0 +1,94 @@
+from modules.datastore import DATASETS
+from modules.index import NameIndex
+from modules.logger import get_logger
+from modules.models import normalize_name, parse_agents, parse_maps, parse_tanks
+
+logger = get_logger()
+
+# Datasets with filtered views, and how their models are parsed
+VIEW_DATASETS = {
+    "tanks": parse_tanks,
+    "maps": parse_maps,
+    "agents": parse_agents,
+}
+
+
+# Filtered slices of one dataset's models, with a name index for autocomplete
+class ModelView:
+    __slots__ = ("all", "available", "displayed", "by_key", "names", "index")
+
+    def __init__(self, models: tuple):
+        self.all = models
+        self.available = tuple(model for model in models if model.available)
+        self.displayed = tuple(model for model in models if model.displayed)
+        self.by_key = {model.key: model for model in self.available}
+        self.names = tuple(sorted(model.name for model in self.available))
+        self.index = NameIndex([model.name for model in self.available])
+
+    # Find an available model by name, case-insensitively
+    def find(self, name: str):
+        return self.by_key.get(normalize_name(name))
+
+
+# Parse a dataset and build its view in one worker job
+def _build_view(parser, data) -> ModelView:
+    return ModelView(parser(data))
+
+
+# Available tank names grouped by nation, both sorted
+def _group_by_nation(view: ModelView) -> dict:
+    tanks_by_nation = {}
+    for tank in view.available:
+        tanks_by_nation.setdefault(tank.nation or "Unknown", []).append(tank.name)
+
+    return {
+        nation_name: sorted(tanks_by_nation[nation_name])
+        for nation_name in sorted(tanks_by_nation)
+    }
+
+
+# Available/displayed views per dataset, built on a worker once per data version
+class DatasetViews:
+    def __init__(self, datastore):
+        self.datastore = datastore
+        self.urls = {DATASETS[name]: name for name in VIEW_DATASETS}
+        self.nations = (None, None)
+
+    # Get the view of a dataset, or None until it has been fetched
+    async def get(self, name: str) -> ModelView:
+        parser = VIEW_DATASETS[name]
+        return await self.datastore.derive_async(
+            DATASETS[name], "view", lambda data: _build_view(parser, data)
+        )
+
+    async def tanks(self) -> ModelView:
+        return await self.get("tanks")
+
+    async def maps(self) -> ModelView:
+        return await self.get("maps")
+
+    async def agents(self) -> ModelView:
+        return await self.get("agents")
+
+    # Available tank names grouped by nation, kept with the view they came from
+    async def tanks_by_nation(self) -> dict:
+        view = await self.tanks()
+        if view is None:
+            return None
+        if self.nations[0] is not view:
+            self.nations = (view, _group_by_nation(view))
+        return self.nations[1]
+
+    # Rebuild the views as soon as their dataset changes
+    async def on_dataset_changed(self, url: str, data):
+        name = self.urls.get(url)
+        if name is None:
+            return
+        view = await self.get(name)
+        if name == "tanks":
+            await self.tanks_by_nation()
+        if view is not None:
+            logger.debug(
+                f"Rebuilt {name} views: {len(view.available)} available, "
+                f"{len(view.displayed)} displayed"
+            )
@@ -0,0 +1,117 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from modules.logger import get_logger
+
+logger = get_logger()
+
+
+# Timings for one kind of job
+class JobMetrics:
+    __slots__ = ("runs", "in_process", "errors", "total_ms", "max_ms", "last_ms")
+
+    def __init__(self):
+        self.runs = 0
+        self.in_process = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def record(self, elapsed_ms: float, in_process: bool):
+        self.runs += 1
+        self.in_process += in_process
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_ms = elapsed_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "in_process": self.in_process,
+            "errors": self.errors,
+            "avg_ms": self.total_ms / self.runs if self.runs else 0.0,
+            "max_ms": self.max_ms,
+            "last_ms": self.last_ms,
+        }
+
+
+# Bounded pools that keep CPU-bound parsing and index building off the event loop
+class WorkerPool:
+    def __init__(self):
+        self.threads = int(os.getenv("WORKER_THREADS", "4"))
+        self.processes = int(os.getenv("WORKER_PROCESSES", "2"))  # 0 to disable
+        self.process_threshold = (
+            int(os.getenv("WORKER_PROCESS_THRESHOLD_KB", "512")) * 1024
+        )
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="worker"
+        )
+        self.process_pool = None
+        self.metrics = {}
+
+        logger.info(
+            f"Worker pool initialized with {self.threads} threads and "
+            f"{self.processes} processes for payloads over "
+            f"{self.process_threshold // 1024} KB"
+        )
+
+    # Start the process pool on the first large payload
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self.process_pool is None and self.processes > 0:
+            # Spawned workers don't inherit the bot's sockets or running loop
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self.process_pool
+
+    def _get_metrics(self, name: str) -> JobMetrics:
+        if name not in self.metrics:
+            self.metrics[name] = JobMetrics()
+        return self.metrics[name]
+
+    # Run a job on a worker, payloads of size bytes or more in a separate process
+    async def run(self, name: str, function, *args, size: int = 0):
+        loop = asyncio.get_running_loop()
+        metrics = self._get_metrics(name)
+        pool = None
+        if size >= self.process_threshold:
+            pool = self._get_process_pool()
+        start = time.perf_counter()
+
+        try:
+            if pool is not None:
+                try:
+                    result = await loop.run_in_executor(pool, function, *args)
+                except BrokenProcessPool:
+                    # A dead worker takes the pool with it, the next job starts a new one
+                    logger.warning(f"Worker process pool broke during {name} job")
+                    if self.process_pool is pool:
+                        self.process_pool = None
+                    pool.shutdown(wait=False)
+                    pool = None
+                    result = await loop.run_in_executor(
+                        self.thread_pool, function, *args
+                    )
+            else:
+                result = await loop.run_in_executor(self.thread_pool, function, *args)
+        except Exception:
+            metrics.errors += 1
+            raise
+
+        metrics.record((time.perf_counter() - start) * 1000, pool is not None)
+        return result
+
+    # Get per-job timings
+    def get_stats(self) -> dict:
+        return {name: metrics.to_dict() for name, metrics in self.metrics.items()}
+
+    def close(self):
+        self.thread_pool.shutdown(wait=False, cancel_futures=True)
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+            self.process_pool = None